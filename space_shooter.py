@@ -1,1427 +1,2036 @@
-"""
-Space Shooter Game - Enhanced Edition
-A classic vertical scrolling shooter with menus and character selection
-
-Controls:
-- Mouse: Navigate menus and click buttons
-- Left/Right Arrow Keys: Move ship
-- Space: Shoot laser
-- ESC: Pause/Return to menu
-"""
-
-import pygame
-import random
-import os
-import sys
-import json
-from PIL import Image
-
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()
-
-# Game Constants
-SCREEN_WIDTH = 1280
-SCREEN_HEIGHT = 720
-FPS = 60
-
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 100, 255)
-DARK_BLUE = (0, 50, 150)
-YELLOW = (255, 255, 0)
-GRAY = (150, 150, 150)
-DARK_GRAY = (50, 50, 50)
-LIGHT_GRAY = (200, 200, 200)
-
-# Asset path helpers
-def get_image_path(filename):
-    """Helper function to get image asset path"""
-    return os.path.join("Assets", "Images", filename)
-
-def get_audio_path(filename):
-    """Helper function to get audio asset path"""
-    return os.path.join("Assets", "Audio", filename)
-
-def get_font_path(filename):
-    """Helper function to get font asset path"""
-    return os.path.join("Assets", "Fonts", filename)
-
-
-class Button:
-    """Clickable button class for UI elements"""
-    
-    def __init__(self, x, y, width, height, text, font, color=BLUE, hover_color=LIGHT_GRAY, text_color=WHITE):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.font = font
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.is_hovered = False
-    
-    def draw(self, screen):
-        """Draw button with hover effect"""
-        current_color = self.hover_color if self.is_hovered else self.color
-        # Draw button background with border
-        pygame.draw.rect(screen, current_color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, WHITE, self.rect, 3, border_radius=10)
-        
-        # Draw text centered
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
-    
-    def check_hover(self, mouse_pos):
-        """Check if mouse is hovering over button"""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-        return self.is_hovered
-    
-    def is_clicked(self, mouse_pos, mouse_pressed):
-        """Check if button is clicked"""
-        return self.rect.collidepoint(mouse_pos) and mouse_pressed[0]
-
-
-class Slider:
-    """Volume slider for settings"""
-    
-    def __init__(self, x, y, width, height, min_val=0, max_val=100, initial_val=50, label=""):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.min_val = min_val
-        self.max_val = max_val
-        self.value = initial_val
-        self.label = label
-        self.dragging = False
-        self.was_dragging = False
-        self.handle_radius = 12
-    
-    def draw(self, screen, font):
-        """Draw slider with label and value"""
-        # Draw label
-        label_surface = font.render(f"{self.label}: {int(self.value)}%", True, WHITE)
-        screen.blit(label_surface, (self.rect.x, self.rect.y - 30))
-        
-        # Draw slider track
-        pygame.draw.rect(screen, GRAY, self.rect, border_radius=5)
-        
-        # Calculate handle position
-        handle_x = self.rect.x + (self.value / self.max_val) * self.rect.width
-        handle_pos = (int(handle_x), self.rect.centery)
-        
-        # Draw handle
-        pygame.draw.circle(screen, WHITE, handle_pos, self.handle_radius)
-        pygame.draw.circle(screen, BLUE, handle_pos, self.handle_radius - 3)
-    
-    def handle_event(self, event, mouse_pos):
-        """Handle mouse events for slider, returns True when released after dragging"""
-        handle_x = self.rect.x + (self.value / self.max_val) * self.rect.width
-        handle_rect = pygame.Rect(handle_x - self.handle_radius, self.rect.centery - self.handle_radius,
-                                   self.handle_radius * 2, self.handle_radius * 2)
-        
-        released = False
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if handle_rect.collidepoint(mouse_pos) or self.rect.collidepoint(mouse_pos):
-                self.dragging = True
-                self.was_dragging = True
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if self.was_dragging:
-                released = True
-                self.was_dragging = False
-            self.dragging = False
-        elif event.type == pygame.MOUSEMOTION and self.dragging:
-            # Update value based on mouse position
-            relative_x = mouse_pos[0] - self.rect.x
-            self.value = max(self.min_val, min(self.max_val, (relative_x / self.rect.width) * self.max_val))
-        
-        return released
-    
-    def get_value(self):
-        """Get current value as 0-1 range"""
-        return self.value / 100.0
-
-
-class Checkbox:
-    """Checkbox for settings"""
-    
-    def __init__(self, x, y, size, label, checked=False):
-        self.rect = pygame.Rect(x, y, size, size)
-        self.label = label
-        self.checked = checked
-    
-    def draw(self, screen, font):
-        """Draw checkbox with label"""
-        # Draw checkbox
-        pygame.draw.rect(screen, WHITE, self.rect, 3)
-        if self.checked:
-            # Draw checkmark
-            pygame.draw.line(screen, GREEN, (self.rect.x + 5, self.rect.centery),
-                           (self.rect.centerx, self.rect.bottom - 5), 3)
-            pygame.draw.line(screen, GREEN, (self.rect.centerx, self.rect.bottom - 5),
-                           (self.rect.right - 5, self.rect.top + 5), 3)
-        
-        # Draw label
-        label_surface = font.render(self.label, True, WHITE)
-        screen.blit(label_surface, (self.rect.right + 15, self.rect.y))
-    
-    def handle_click(self, mouse_pos):
-        """Toggle checkbox if clicked"""
-        if self.rect.collidepoint(mouse_pos):
-            self.checked = not self.checked
-            return True
-        return False
-
-
-class Dropdown:
-    """Dropdown menu for selecting options"""
-    
-    def __init__(self, x, y, width, height, options, label="", initial_index=0):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.options = options
-        self.label = label
-        self.selected_index = initial_index
-        self.is_open = False
-        self.option_rects = []
-    
-    def draw(self, screen, font):
-        """Draw dropdown with label"""
-        # Draw label
-        if self.label:
-            label_surface = font.render(self.label, True, WHITE)
-            screen.blit(label_surface, (self.rect.x, self.rect.y - 30))
-        
-        # Draw main box
-        pygame.draw.rect(screen, GRAY, self.rect)
-        pygame.draw.rect(screen, WHITE, self.rect, 2)
-        
-        # Draw selected option
-        text_surface = font.render(self.options[self.selected_index], True, WHITE)
-        screen.blit(text_surface, (self.rect.x + 10, self.rect.y + 5))
-        
-        # Draw arrow
-        arrow_x = self.rect.right - 25
-        arrow_y = self.rect.centery
-        if self.is_open:
-            # Up arrow
-            pygame.draw.polygon(screen, WHITE, [
-                (arrow_x, arrow_y + 5),
-                (arrow_x - 5, arrow_y - 5),
-                (arrow_x + 5, arrow_y - 5)
-            ])
-        else:
-            # Down arrow
-            pygame.draw.polygon(screen, WHITE, [
-                (arrow_x, arrow_y + 5),
-                (arrow_x - 5, arrow_y - 5),
-                (arrow_x + 5, arrow_y - 5)
-            ])
-        
-        # Draw options if open
-        if self.is_open:
-            self.option_rects = []
-            for i, option in enumerate(self.options):
-                option_rect = pygame.Rect(self.rect.x, self.rect.y + self.rect.height * (i + 1),
-                                         self.rect.width, self.rect.height)
-                self.option_rects.append(option_rect)
-                
-                # Highlight on hover
-                mouse_pos = pygame.mouse.get_pos()
-                if option_rect.collidepoint(mouse_pos):
-                    pygame.draw.rect(screen, BLUE, option_rect)
-                else:
-                    pygame.draw.rect(screen, GRAY, option_rect)
-                
-                pygame.draw.rect(screen, WHITE, option_rect, 2)
-                option_surface = font.render(option, True, WHITE)
-                screen.blit(option_surface, (option_rect.x + 10, option_rect.y + 5))
-    
-    def handle_click(self, mouse_pos):
-        """Handle dropdown clicks, returns True if selection changed"""
-        if self.rect.collidepoint(mouse_pos):
-            self.is_open = not self.is_open
-            return False
-        
-        if self.is_open:
-            for i, option_rect in enumerate(self.option_rects):
-                if option_rect.collidepoint(mouse_pos):
-                    self.selected_index = i
-                    self.is_open = False
-                    return True
-            # Click outside closes dropdown
-            self.is_open = False
-        
-        return False
-    
-    def get_selected(self):
-        """Get currently selected option"""
-        return self.options[self.selected_index]
-
-
-class Player:
-    """Player spaceship class"""
-    
-    def __init__(self, x, y, player_type="player.png"):
-        self.x = x
-        self.y = y
-        self.speed = 8
-        self.player_type = player_type
-        
-        # Try to load player image
-        try:
-            self.image = pygame.image.load(get_image_path(player_type))
-            original_width = self.image.get_width()
-            original_height = self.image.get_height()
-            # Scale to max 80px width while maintaining aspect ratio
-            if original_width > 80:
-                scale_factor = 80 / original_width
-                self.width = 80
-                self.height = int(original_height * scale_factor)
-            else:
-                self.width = original_width
-                self.height = original_height
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            self.has_image = True
-        except Exception as e:
-            self.has_image = False
-            self.width = 64
-            self.height = 64
-            print(f"Warning: {player_type} not found. Using rectangle.")
-    
-    def move_left(self):
-        """Move player left with boundary checking"""
-        self.x -= self.speed
-        if self.x < 0:
-            self.x = 0
-    
-    def move_right(self):
-        """Move player right with boundary checking"""
-        self.x += self.speed
-        if self.x > SCREEN_WIDTH - self.width:
-            self.x = SCREEN_WIDTH - self.width
-    
-    def draw(self, screen):
-        """Draw the player on screen"""
-        if self.has_image:
-            screen.blit(self.image, (self.x, self.y))
-        else:
-            pygame.draw.rect(screen, GREEN, (self.x, self.y, self.width, self.height))
-    
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Bullet:
-    """Bullet/Laser projectile class"""
-    
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.speed = 7
-        
-        # Try to load bullet image
-        try:
-            self.image = pygame.image.load(get_image_path("bullet.png"))
-            original_width = self.image.get_width()
-            original_height = self.image.get_height()
-            if original_width > 16:
-                scale_factor = 16 / original_width
-                self.width = 16
-                self.height = int(original_height * scale_factor)
-            else:
-                self.width = original_width
-                self.height = original_height
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            self.has_image = True
-        except:
-            self.has_image = False
-            self.width = 8
-            self.height = 32
-    
-    def update(self):
-        """Move bullet upward"""
-        self.y -= self.speed
-    
-    def is_off_screen(self):
-        """Check if bullet has left the screen"""
-        return self.y < -self.height
-    
-    def draw(self, screen):
-        """Draw the bullet on screen"""
-        if self.has_image:
-            screen.blit(self.image, (self.x, self.y))
-        else:
-            pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
-    
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Enemy:
-    """Enemy spaceship class"""
-    
-    def __init__(self, x, y, speed_multiplier=1.0):
-        self.x = x
-        self.y = y
-        self.speed = 2 * speed_multiplier
-        
-        # Try to load enemy image
-        try:
-            self.image = pygame.image.load(get_image_path("enemy.png"))
-            original_width = self.image.get_width()
-            original_height = self.image.get_height()
-            if original_width > 70:
-                scale_factor = 70 / original_width
-                self.width = 70
-                self.height = int(original_height * scale_factor)
-            else:
-                self.width = original_width
-                self.height = original_height
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            self.has_image = True
-        except:
-            self.has_image = False
-            self.width = 64
-            self.height = 64
-    
-    def update(self):
-        """Move enemy downward"""
-        self.y += self.speed
-    
-    def is_off_screen(self):
-        """Check if enemy has left the bottom of screen"""
-        return self.y > SCREEN_HEIGHT
-    
-    def draw(self, screen):
-        """Draw the enemy on screen"""
-        if self.has_image:
-            screen.blit(self.image, (self.x, self.y))
-        else:
-            pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height))
-    
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Game:
-    """Main game class"""
-    
-    def __init__(self):
-        # Initialize display
-        self.fullscreen = False
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Space Shooter")
-        self.clock = pygame.time.Clock()
-        
-        # Load fonts
-        try:
-            self.retro_font_small = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 24)
-            self.retro_font_medium = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 36)
-            self.retro_font_large = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 48)
-            self.oleaguid_font = pygame.font.Font(get_font_path("Oleaguid.ttf"), 72)
-            print("Custom fonts loaded successfully")
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
-            self.retro_font_small = pygame.font.Font(None, 24)
-            self.retro_font_medium = pygame.font.Font(None, 36)
-            self.retro_font_large = pygame.font.Font(None, 48)
-            self.oleaguid_font = pygame.font.Font(None, 72)
-        
-        # Load background
-        self.load_background()
-        
-        # Audio settings
-        self.sfx_volume = 0.5
-        self.music_volume = 0.2
-        self.test_sound_type = "laser"  # Default test sound for SFX slider
-        self.sounds = {}
-        self.load_sounds()
-        
-        # Game state
-        self.state = "MAIN_MENU"
-        self.running = True
-        self.game_over = False
-        self.paused = False
-        self.score = 0
-        self.lives = 5
-        self.difficulty = "medium"  # easy, medium, hard
-        self.game_speed_multiplier = 1.0
-        self.high_scores = self.load_high_scores()  # Dictionary with high score per difficulty
-        self.leaderboards = self.load_leaderboards()
-        self.selected_character = "player.png"
-        self.player_life_icon = None
-        self.player_name = ""
-        self.entering_name = False
-        self.name_error_message = ""
-        self.password_input = ""
-        self.password_error = ""
-        
-        # Game objects
-        self.player = None
-        self.bullets = []
-        self.enemies = []
-        self.enemy_spawn_timer = 0
-        self.enemy_spawn_delay = 60
-        
-        # Initialize UI
-        self.init_ui()
-        
-        # Start menu music
-        self.play_music("menu")
-    
-    def load_background(self):
-        """Load background image"""
-        self.has_background = False
-        for bg_file in ["background.avif", "background.png", "background.jpg"]:
-            try:
-                bg_path = get_image_path(bg_file)
-                if bg_file.endswith('.avif'):
-                    pil_image = Image.open(bg_path).convert('RGB')
-                    pil_image = pil_image.resize((SCREEN_WIDTH, SCREEN_HEIGHT), Image.Resampling.LANCZOS)
-                    image_string = pil_image.tobytes()
-                    self.background = pygame.image.fromstring(image_string, pil_image.size, pil_image.mode)
-                else:
-                    self.background = pygame.image.load(bg_path)
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.has_background = True
-                print(f"Loaded background: {bg_file}")
-                break
-            except:
-                continue
-    
-    def load_sounds(self):
-        """Load sound effects"""
-        sound_files = {
-            'laser': 'laser.wav',
-            'explosion': 'explosion.wav',
-            'game_over': 'game_over.mp3',
-            'click': 'click.wav'
-        }
-        
-        for name, filename in sound_files.items():
-            try:
-                self.sounds[name] = pygame.mixer.Sound(get_audio_path(filename))
-            except:
-                self.sounds[name] = None
-                print(f"Warning: Could not load {filename}")
-        
-        # Load gameplay background music
-        self.gameplay_music_loaded = False
-        for music_file in ["background_music.mp3", "background_music.ogg", "background_music.wav"]:
-            try:
-                # Store the path for later use
-                self.gameplay_music_path = get_audio_path(music_file)
-                pygame.mixer.music.load(self.gameplay_music_path)
-                self.gameplay_music_loaded = True
-                print(f"Loaded gameplay music: {music_file}")
-                break
-            except:
-                continue
-        
-        # Load main menu music
-        self.menu_music_loaded = False
-        for music_file in ["main_menu_music.mp3", "main_menu_music.ogg", "main_menu_music.wav"]:
-            try:
-                self.menu_music_path = get_audio_path(music_file)
-                # Don't load it yet, just store the path
-                self.menu_music_loaded = True
-                print(f"Found menu music: {music_file}")
-                break
-            except:
-                continue
-        
-        self.current_music = None  # Track which music is playing
-        self.update_volumes()
-    
-    def update_volumes(self):
-        """Update sound volumes"""
-        if self.sounds.get('explosion'):
-            self.sounds['explosion'].set_volume(0.1 * self.sfx_volume)
-        if self.sounds.get('game_over'):
-            self.sounds['game_over'].set_volume(0.25 * self.sfx_volume)
-        if self.sounds.get('laser'):
-            self.sounds['laser'].set_volume(self.sfx_volume)
-        if self.sounds.get('click'):
-            self.sounds['click'].set_volume(0.3 * self.sfx_volume)  # 30% volume for clicks
-        pygame.mixer.music.set_volume(self.music_volume)
-    
-    def play_sound(self, name):
-        """Play sound effect"""
-        if self.sounds.get(name):
-            self.sounds[name].play()
-    
-    def play_music(self, music_type):
-        """Play menu or gameplay music"""
-        if music_type == "menu" and self.menu_music_loaded:
-            if self.current_music != "menu":
-                pygame.mixer.music.stop()
-                pygame.mixer.music.load(self.menu_music_path)
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1)
-                self.current_music = "menu"
-        elif music_type == "gameplay" and self.gameplay_music_loaded:
-            if self.current_music != "gameplay":
-                pygame.mixer.music.stop()
-                pygame.mixer.music.load(self.gameplay_music_path)
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1)
-                self.current_music = "gameplay"
-    
-    def toggle_fullscreen(self):
-        """Toggle fullscreen mode"""
-        self.fullscreen = not self.fullscreen
-        if self.fullscreen:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-        else:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    
-    def init_ui(self):
-        """Initialize UI elements"""
-        cx = SCREEN_WIDTH // 2
-        
-        # Main menu
-        self.main_menu_buttons = {
-            'start': Button(cx - 150, 260, 300, 60, "START", self.retro_font_medium),
-            'leaderboard': Button(cx - 150, 340, 300, 60, "LEADERBOARD", self.retro_font_medium),
-            'settings': Button(cx - 150, 420, 300, 60, "SETTINGS", self.retro_font_medium),
-            'quit': Button(cx - 150, 500, 300, 60, "QUIT", self.retro_font_medium)
-        }
-        
-        # Character selection
-        self.character_buttons = []
-        characters = [("player.png", "SHIP 1"), ("player2.PNG", "SHIP 2"), ("player3.png", "SHIP 3")]
-        for i, (char_file, char_name) in enumerate(characters):
-            x = cx - 270 + (i * 180)
-            self.character_buttons.append({
-                'file': char_file,
-                'name': char_name,
-                'button': Button(x, 450, 150, 50, "SELECT", self.retro_font_small),
-                'preview_rect': pygame.Rect(x, 250, 150, 150),
-                'image': self.load_character_preview(char_file)
-            })
-        self.char_back_button = Button(50, 50, 150, 50, "BACK", self.retro_font_small)
-        
-        # Difficulty selection
-        self.difficulty_buttons = {
-            'easy': Button(cx - 350, 320, 200, 70, "EASY", self.retro_font_medium, GREEN, LIGHT_GRAY),
-            'medium': Button(cx - 100, 320, 200, 70, "MEDIUM", self.retro_font_medium, BLUE, LIGHT_GRAY),
-            'hard': Button(cx + 150, 320, 200, 70, "HARD", self.retro_font_medium, RED, LIGHT_GRAY)
-        }
-        self.difficulty_back_button = Button(50, 50, 150, 50, "BACK", self.retro_font_small)
-        
-        # Leaderboard
-        self.leaderboard_buttons = {
-            'easy': Button(cx - 380, 180, 230, 50, "EASY", self.retro_font_small, GREEN, LIGHT_GRAY),
-            'medium': Button(cx - 115, 180, 230, 50, "MEDIUM", self.retro_font_small, BLUE, LIGHT_GRAY),
-            'hard': Button(cx + 150, 180, 230, 50, "HARD", self.retro_font_small, RED, LIGHT_GRAY)
-        }
-        self.leaderboard_back_button = Button(cx - 100, 650, 200, 50, "BACK", self.retro_font_medium)
-        self.clear_leaderboard_button = Button(cx + 300, 650, 180, 50, "CLEAR ALL", self.retro_font_small, RED, LIGHT_GRAY)
-        self.active_leaderboard = "medium"
-        
-        # Password entry (for clearing leaderboards)
-        self.password_entry_rect = pygame.Rect(cx - 200, 300, 400, 50)
-        self.submit_password_button = Button(cx - 100, 380, 200, 50, "SUBMIT", self.retro_font_medium)
-        self.cancel_password_button = Button(cx - 100, 450, 200, 50, "CANCEL", self.retro_font_medium)
-        
-        # Name entry (for high score)
-        self.name_entry_rect = pygame.Rect(cx - 200, 300, 400, 50)
-        self.submit_name_button = Button(cx - 100, 380, 200, 50, "SUBMIT", self.retro_font_medium)
-        
-        # Settings
-        self.sfx_slider = Slider(cx - 200, 250, 400, 20, 0, 100, self.sfx_volume * 100, "SFX Volume")
-        self.music_slider = Slider(cx - 200, 350, 400, 20, 0, 100, self.music_volume * 100, "Music Volume")
-        self.test_sound_dropdown = Dropdown(cx - 200, 470, 400, 40, ["Laser", "Explosion"], "Test Sound", 0)
-        self.fullscreen_checkbox = Checkbox(cx - 100, 570, 30, "Fullscreen Mode", self.fullscreen)
-        self.settings_back_button = Button(cx - 100, 650, 200, 50, "BACK", self.retro_font_medium)
-        
-        # Game over
-        self.game_over_buttons = {
-            'restart': Button(cx - 250, 400, 200, 60, "RESTART", self.retro_font_medium),
-            'menu': Button(cx + 50, 400, 200, 60, "MENU", self.retro_font_medium)
-        }
-        
-        # Quit confirm
-        self.quit_confirm_buttons = {
-            'yes': Button(cx - 200, 350, 150, 60, "YES", self.retro_font_medium, RED, LIGHT_GRAY),
-            'no': Button(cx + 50, 350, 150, 60, "NO", self.retro_font_medium, GREEN, LIGHT_GRAY)
-        }
-        
-        # Pause menu
-        self.pause_buttons = {
-            'resume': Button(cx - 150, 300, 300, 60, "RESUME", self.retro_font_medium),
-            'settings': Button(cx - 150, 380, 300, 60, "SETTINGS", self.retro_font_medium),
-            'menu': Button(cx - 150, 460, 300, 60, "QUIT TO MENU", self.retro_font_medium)
-        }
-    
-    def load_character_preview(self, filename):
-        """Load and scale character preview"""
-        try:
-            img = pygame.image.load(get_image_path(filename))
-            return pygame.transform.scale(img, (120, 120))
-        except:
-            return None
-    
-    def load_player_life_icon(self):
-        """Load player life icon (small version of selected ship)"""
-        try:
-            img = pygame.image.load(get_image_path(self.selected_character))
-            self.player_life_icon = pygame.transform.scale(img, (30, 30))
-        except:
-            self.player_life_icon = None
-    
-    def load_high_scores(self):
-        """Load high scores from file"""
-        try:
-            if os.path.exists("high_scores.json"):
-                with open("high_scores.json", "r") as f:
-                    return json.load(f)
-        except:
-            pass
-        return {"easy": 0, "medium": 0, "hard": 0}
-    
-    def save_high_scores(self):
-        """Save high scores to file"""
-        try:
-            with open("high_scores.json", "w") as f:
-                json.dump(self.high_scores, f, indent=2)
-        except Exception as e:
-            print(f"Error saving high scores: {e}")
-    
-    def load_leaderboards(self):
-        """Load leaderboards from file"""
-        try:
-            if os.path.exists("leaderboards.json"):
-                with open("leaderboards.json", "r") as f:
-                    return json.load(f)
-        except:
-            pass
-        return {"easy": [], "medium": [], "hard": []}
-    
-    def save_leaderboards(self):
-        """Save leaderboards to file"""
-        try:
-            with open("leaderboards.json", "w") as f:
-                json.dump(self.leaderboards, f, indent=2)
-        except Exception as e:
-            print(f"Error saving leaderboards: {e}")
-    
-    def add_to_leaderboard(self, name, score, difficulty):
-        """Add score to leaderboard and keep top 10"""
-        entry = {"name": name[:10], "score": score}  # Limit name to 10 chars
-        self.leaderboards[difficulty].append(entry)
-        # Sort by score (descending) and keep top 10
-        self.leaderboards[difficulty].sort(key=lambda x: x["score"], reverse=True)
-        self.leaderboards[difficulty] = self.leaderboards[difficulty][:10]
-        self.save_leaderboards()
-    
-    def validate_name(self, name):
-        """Validate player name for leaderboard"""
-        # Check if empty
-        if not name or name.strip() == "":
-            return False, "Please enter a name!"
-        
-        # Check if name already exists in this difficulty's leaderboard
-        leaderboard = self.leaderboards[self.difficulty]
-        for entry in leaderboard:
-            if entry["name"].upper() == name.upper():
-                return False, "Username already taken!"
-        
-        return True, ""
-    
-    def clear_all_leaderboards(self):
-        """Clear all leaderboards and high scores"""
-        self.leaderboards = {"easy": [], "medium": [], "hard": []}
-        self.high_scores = {"easy": 0, "medium": 0, "hard": 0}
-        self.save_leaderboards()
-        self.save_high_scores()
-        print("All leaderboards and high scores cleared!")
-    
-    def start_game(self):
-        """Start the game"""
-        self.state = "PLAYING"
-        self.game_over = False
-        self.paused = False
-        self.score = 0
-        
-        # Set lives based on difficulty
-        if self.difficulty == "easy":
-            self.lives = 7
-            self.game_speed_multiplier = 1.0
-        elif self.difficulty == "medium":
-            self.lives = 5
-            self.game_speed_multiplier = 1.08
-        else:  # hard
-            self.lives = 3
-            self.game_speed_multiplier = 1.15
-        
-        self.player = Player(SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT - 120, self.selected_character)
-        self.bullets = []
-        self.enemies = []
-        self.enemy_spawn_timer = 0
-        self.load_player_life_icon()
-        self.play_music("gameplay")
-    
-    def spawn_enemy(self):
-        """Spawn enemy"""
-        temp = Enemy(0, -100, self.game_speed_multiplier)
-        x = random.randint(0, SCREEN_WIDTH - temp.width)
-        self.enemies.append(Enemy(x, -temp.height, self.game_speed_multiplier))
-    
-    def shoot_bullet(self):
-        """Shoot bullet"""
-        if self.player:
-            x = self.player.x + self.player.width // 2 - 4
-            self.bullets.append(Bullet(x, self.player.y))
-            self.play_sound('laser')
-    
-    def check_collisions(self):
-        """Check collisions"""
-        for bullet in self.bullets[:]:
-            for enemy in self.enemies[:]:
-                if bullet.get_rect().colliderect(enemy.get_rect()):
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
-                    if enemy in self.enemies:
-                        self.enemies.remove(enemy)
-                    self.score += 10
-                    self.play_sound('explosion')
-                    break
-        
-        # Check enemy collision with player
-        if self.player:
-            for enemy in self.enemies[:]:
-                if self.player.get_rect().colliderect(enemy.get_rect()):
-                    if enemy in self.enemies:
-                        self.enemies.remove(enemy)
-                    self.lives -= 1
-                    self.play_sound('explosion')
-                    if self.lives <= 0:
-                        self.end_game()
-                    break
-    
-    def end_game(self):
-        """End the game and update high score"""
-        self.game_over = True
-        pygame.mixer.music.stop()
-        self.play_sound('game_over')
-        
-        # Update high score for this difficulty if needed
-        if self.score > self.high_scores[self.difficulty]:
-            self.high_scores[self.difficulty] = self.score
-            self.save_high_scores()
-        
-        # Check if score qualifies for leaderboard (top 10 or less than 10 entries)
-        leaderboard = self.leaderboards[self.difficulty]
-        if len(leaderboard) < 10 or self.score > leaderboard[-1]["score"]:
-            self.entering_name = True
-            self.player_name = ""
-            self.name_error_message = ""
-            self.state = "NAME_ENTRY"
-        else:
-            self.state = "GAME_OVER"
-    
-    def update_game(self):
-        """Update game"""
-        if self.game_over:
-            return
-        
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.is_off_screen():
-                self.bullets.remove(bullet)
-        
-        for enemy in self.enemies[:]:
-            enemy.update()
-            if enemy.is_off_screen():
-                self.enemies.remove(enemy)
-                # Lose a life when enemy passes through
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.end_game()
-        
-        self.enemy_spawn_timer += 1
-        if self.enemy_spawn_timer >= self.enemy_spawn_delay:
-            self.spawn_enemy()
-            self.enemy_spawn_timer = 0
-        
-        self.check_collisions()
-    
-    def handle_game_input(self):
-        """Handle game input"""
-        if not self.game_over and self.player:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                self.player.move_left()
-            if keys[pygame.K_RIGHT]:
-                self.player.move_right()
-    
-    def draw_background(self):
-        """Draw background"""
-        if self.has_background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(BLACK)
-        
-        if self.state != "PLAYING":
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(150)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
-    
-    def draw_main_menu(self):
-        """Draw main menu"""
-        self.draw_background()
-        
-        title = self.oleaguid_font.render("SPACE SHOOTER", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 150)))
-        
-        subtitle = self.retro_font_small.render("A bored GabTzy project", True, WHITE)
-        self.screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 220)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        for button in self.main_menu_buttons.values():
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-    
-    def draw_character_select(self):
-        """Draw character selection"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("SELECT YOUR SHIP", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 120)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        for char in self.character_buttons:
-            # Draw preview
-            pygame.draw.rect(self.screen, DARK_BLUE, char['preview_rect'], border_radius=10)
-            pygame.draw.rect(self.screen, WHITE if char['file'] == self.selected_character else GRAY, 
-                           char['preview_rect'], 3, border_radius=10)
-            
-            if char['image']:
-                img_rect = char['image'].get_rect(center=char['preview_rect'].center)
-                self.screen.blit(char['image'], img_rect)
-            
-            # Draw name
-            name_text = self.retro_font_small.render(char['name'], True, WHITE)
-            name_rect = name_text.get_rect(center=(char['preview_rect'].centerx, char['preview_rect'].bottom + 30))
-            self.screen.blit(name_text, name_rect)
-            
-            # Draw button
-            char['button'].check_hover(mouse_pos)
-            char['button'].draw(self.screen)
-        
-        self.char_back_button.check_hover(mouse_pos)
-        self.char_back_button.draw(self.screen)
-    
-    def draw_settings(self):
-        """Draw settings"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("SETTINGS", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 120)))
-        
-        self.sfx_slider.draw(self.screen, self.retro_font_small)
-        self.music_slider.draw(self.screen, self.retro_font_small)
-        self.test_sound_dropdown.draw(self.screen, self.retro_font_small)
-        self.fullscreen_checkbox.draw(self.screen, self.retro_font_small)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.settings_back_button.check_hover(mouse_pos)
-        self.settings_back_button.draw(self.screen)
-    
-    def draw_playing(self):
-        """Draw gameplay"""
-        self.draw_background()
-        
-        if self.player:
-            self.player.draw(self.screen)
-        
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
-        
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
-        
-        # Draw score
-        score_text = self.retro_font_medium.render(f"SCORE: {self.score}", True, YELLOW)
-        self.screen.blit(score_text, (10, 10))
-        
-        # Draw high score for current difficulty
-        high_score_text = self.retro_font_small.render(f"HIGH SCORE: {self.high_scores[self.difficulty]}", True, WHITE)
-        self.screen.blit(high_score_text, (10, 50))
-        
-        # Draw lives with player icon
-        lives_text = self.retro_font_medium.render(str(self.lives), True, GREEN)
-        lives_x = SCREEN_WIDTH - 80
-        self.screen.blit(lives_text, (lives_x, 10))
-        
-        # Draw player life icon
-        if self.player_life_icon:
-            icon_x = lives_x - 40
-            self.screen.blit(self.player_life_icon, (icon_x, 15))
-    
-    def draw_game_over(self):
-        """Draw game over"""
-        self.draw_background()
-        
-        title = self.oleaguid_font.render("GAME OVER", True, RED)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 200)))
-        
-        score_text = self.retro_font_large.render(f"FINAL SCORE: {self.score}", True, WHITE)
-        self.screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 310)))
-        
-        high_score_text = self.retro_font_medium.render(f"HIGH SCORE: {self.high_scores[self.difficulty]}", True, YELLOW)
-        self.screen.blit(high_score_text, high_score_text.get_rect(center=(SCREEN_WIDTH // 2, 360)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        for button in self.game_over_buttons.values():
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-    
-    def draw_quit_confirm(self):
-        """Draw quit confirmation"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("ARE YOU SURE?", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 220)))
-        
-        subtitle = self.retro_font_small.render("Do you want to quit the game?", True, WHITE)
-        self.screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 290)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        for button in self.quit_confirm_buttons.values():
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-    
-    def draw_paused(self):
-        """Draw pause screen"""
-        # Draw the game in background (frozen)
-        if self.has_background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(BLACK)
-        
-        # Draw frozen game elements
-        if self.player:
-            self.player.draw(self.screen)
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
-        
-        # Draw score and lives (frozen state)
-        score_text = self.retro_font_medium.render(f"SCORE: {self.score}", True, YELLOW)
-        self.screen.blit(score_text, (10, 10))
-        
-        high_score_text = self.retro_font_small.render(f"HIGH SCORE: {self.high_scores[self.difficulty]}", True, WHITE)
-        self.screen.blit(high_score_text, (10, 50))
-        
-        lives_text = self.retro_font_medium.render(str(self.lives), True, GREEN)
-        lives_x = SCREEN_WIDTH - 80
-        self.screen.blit(lives_text, (lives_x, 10))
-        
-        if self.player_life_icon:
-            icon_x = lives_x - 40
-            self.screen.blit(self.player_life_icon, (icon_x, 15))
-        
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Draw PAUSED title
-        title = self.oleaguid_font.render("PAUSED", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 200)))
-        
-        # Draw subtitle
-        subtitle = self.retro_font_small.render("Game is paused - Choose an option", True, WHITE)
-        self.screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 280)))
-        
-        # Draw buttons
-        mouse_pos = pygame.mouse.get_pos()
-        for button in self.pause_buttons.values():
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-    
-    def draw_difficulty_select(self):
-        """Draw difficulty selection"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("SELECT DIFFICULTY", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 120)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Draw buttons and show info only on hover
-        for diff, button in self.difficulty_buttons.items():
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-            
-            # Show difficulty info only when hovering
-            if button.is_hovered:
-                if diff == "easy":
-                    info_text = "7 Lives | Normal Speed"
-                elif diff == "medium":
-                    info_text = "5 Lives | 8% Faster"
-                else:  # hard
-                    info_text = "3 Lives | 15% Faster"
-                
-                info = self.retro_font_small.render(info_text, True, WHITE)
-                self.screen.blit(info, info.get_rect(center=(button.rect.centerx, button.rect.bottom + 30)))
-        
-        self.difficulty_back_button.check_hover(mouse_pos)
-        self.difficulty_back_button.draw(self.screen)
-    
-    def draw_leaderboard(self):
-        """Draw leaderboard"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("LEADERBOARD", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 80)))
-        
-        # Draw difficulty tabs
-        mouse_pos = pygame.mouse.get_pos()
-        for diff, button in self.leaderboard_buttons.items():
-            if diff == self.active_leaderboard:
-                # Highlight active tab
-                pygame.draw.rect(self.screen, button.color, button.rect.inflate(4, 4), border_radius=8)
-            button.check_hover(mouse_pos)
-            button.draw(self.screen)
-        
-        # Draw leaderboard entries
-        leaderboard = self.leaderboards[self.active_leaderboard]
-        y_start = 260
-        for i, entry in enumerate(leaderboard):
-            rank_text = self.retro_font_small.render(f"#{i+1}", True, YELLOW)
-            name_text = self.retro_font_small.render(entry["name"], True, WHITE)
-            score_text = self.retro_font_small.render(str(entry["score"]), True, GREEN)
-            
-            self.screen.blit(rank_text, (200, y_start + i * 35))
-            self.screen.blit(name_text, (300, y_start + i * 35))
-            self.screen.blit(score_text, (900, y_start + i * 35))
-        
-        # If leaderboard is empty
-        if not leaderboard:
-            empty_text = self.retro_font_medium.render("No scores yet!", True, GRAY)
-            self.screen.blit(empty_text, empty_text.get_rect(center=(SCREEN_WIDTH // 2, 400)))
-        
-        self.leaderboard_back_button.check_hover(mouse_pos)
-        self.leaderboard_back_button.draw(self.screen)
-        
-        self.clear_leaderboard_button.check_hover(mouse_pos)
-        self.clear_leaderboard_button.draw(self.screen)
-    
-    def draw_name_entry(self):
-        """Draw name entry screen"""
-        self.draw_background()
-        
-        title = self.oleaguid_font.render("NEW HIGH SCORE!", True, YELLOW)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 150)))
-        
-        score_text = self.retro_font_large.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 230)))
-        
-        prompt = self.retro_font_small.render("Enter your name (max 10 characters):", True, WHITE)
-        self.screen.blit(prompt, prompt.get_rect(center=(SCREEN_WIDTH // 2, 270)))
-        
-        # Draw input box
-        pygame.draw.rect(self.screen, WHITE, self.name_entry_rect, 3)
-        name_surface = self.retro_font_medium.render(self.player_name + "_", True, WHITE)
-        self.screen.blit(name_surface, (self.name_entry_rect.x + 10, self.name_entry_rect.y + 10))
-        
-        # Draw error message if any
-        if self.name_error_message:
-            error_surface = self.retro_font_small.render(self.name_error_message, True, RED)
-            self.screen.blit(error_surface, error_surface.get_rect(center=(SCREEN_WIDTH // 2, 360)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.submit_name_button.check_hover(mouse_pos)
-        self.submit_name_button.draw(self.screen)
-    
-    def draw_password_entry(self):
-        """Draw password entry screen for clearing leaderboards"""
-        self.draw_background()
-        
-        title = self.retro_font_large.render("ADMIN ACCESS", True, RED)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 150)))
-        
-        warning = self.retro_font_medium.render("Clear All Leaderboards?", True, YELLOW)
-        self.screen.blit(warning, warning.get_rect(center=(SCREEN_WIDTH // 2, 220)))
-        
-        prompt = self.retro_font_small.render("Enter admin password:", True, WHITE)
-        self.screen.blit(prompt, prompt.get_rect(center=(SCREEN_WIDTH // 2, 270)))
-        
-        # Draw password input box (show asterisks)
-        pygame.draw.rect(self.screen, WHITE, self.password_entry_rect, 3)
-        password_display = "*" * len(self.password_input) + "_"
-        password_surface = self.retro_font_medium.render(password_display, True, WHITE)
-        self.screen.blit(password_surface, (self.password_entry_rect.x + 10, self.password_entry_rect.y + 10))
-        
-        # Draw error message if any
-        if self.password_error:
-            error_surface = self.retro_font_small.render(self.password_error, True, RED)
-            self.screen.blit(error_surface, error_surface.get_rect(center=(SCREEN_WIDTH // 2, 360)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.submit_password_button.check_hover(mouse_pos)
-        self.submit_password_button.draw(self.screen)
-        
-        self.cancel_password_button.check_hover(mouse_pos)
-        self.cancel_password_button.draw(self.screen)
-    
-    def handle_events(self):
-        """Handle events"""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                # Password entry
-                if self.state == "PASSWORD_ENTRY":
-                    if event.key == pygame.K_RETURN:
-                        if self.password_input == "admin123":
-                            self.clear_all_leaderboards()
-                            self.password_input = ""
-                            self.password_error = ""
-                            self.state = "LEADERBOARD"
-                        else:
-                            self.password_error = "Incorrect password!"
-                    elif event.key == pygame.K_BACKSPACE:
-                        self.password_input = self.password_input[:-1]
-                        self.password_error = ""
-                    elif event.key == pygame.K_ESCAPE:
-                        self.password_input = ""
-                        self.password_error = ""
-                        self.state = "LEADERBOARD"
-                    elif len(self.password_input) < 20 and event.unicode.isprintable():
-                        self.password_input += event.unicode
-                        self.password_error = ""
-                # Name entry
-                elif self.state == "NAME_ENTRY":
-                    if event.key == pygame.K_RETURN:
-                        is_valid, error_msg = self.validate_name(self.player_name)
-                        if is_valid:
-                            self.add_to_leaderboard(self.player_name, self.score, self.difficulty)
-                            self.entering_name = False
-                            self.state = "GAME_OVER"
-                        else:
-                            self.name_error_message = error_msg
-                    elif event.key == pygame.K_BACKSPACE:
-                        self.player_name = self.player_name[:-1]
-                        self.name_error_message = ""  # Clear error when typing
-                    elif len(self.player_name) < 10 and event.unicode.isprintable():
-                        self.player_name += event.unicode.upper()
-                        self.name_error_message = ""  # Clear error when typing
-                # Only allow ESC to pause during active gameplay
-                elif event.key == pygame.K_ESCAPE and self.state == "PLAYING" and not self.game_over:
-                    self.paused = not self.paused
-                # Allow shooting only when not paused
-                elif event.key == pygame.K_SPACE and self.state == "PLAYING" and not self.game_over and not self.paused:
-                    self.shoot_bullet()
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.state == "PLAYING" and self.paused:
-                    self.handle_pause_click(mouse_pos)
-                elif self.state == "SETTINGS":
-                    self.handle_mouse_click(mouse_pos)
-                else:
-                    self.handle_mouse_click(mouse_pos)
-            
-            # Handle sliders
-            if self.state == "SETTINGS":
-                sfx_released = self.sfx_slider.handle_event(event, mouse_pos)
-                self.music_slider.handle_event(event, mouse_pos)
-                self.sfx_volume = self.sfx_slider.get_value()
-                self.music_volume = self.music_slider.get_value()
-                self.update_volumes()
-                
-                # Play test sound when SFX slider is released
-                if sfx_released:
-                    if self.test_sound_type == "laser":
-                        self.play_sound('laser')
-                    elif self.test_sound_type == "explosion":
-                        self.play_sound('explosion')
-    
-    def handle_mouse_click(self, mouse_pos):
-        """Handle mouse clicks"""
-        if self.state == "MAIN_MENU":
-            if self.main_menu_buttons['start'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "DIFFICULTY_SELECT"
-            elif self.main_menu_buttons['leaderboard'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "LEADERBOARD"
-            elif self.main_menu_buttons['settings'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "SETTINGS"
-            elif self.main_menu_buttons['quit'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "QUIT_CONFIRM"
-        
-        elif self.state == "CHARACTER_SELECT":
-            if self.char_back_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "DIFFICULTY_SELECT"
-            else:
-                for char in self.character_buttons:
-                    if char['button'].rect.collidepoint(mouse_pos):
-                        self.play_sound('click')
-                        self.selected_character = char['file']
-                        self.start_game()
-                        break
-        
-        elif self.state == "DIFFICULTY_SELECT":
-            if self.difficulty_back_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "MAIN_MENU"
-            else:
-                for diff, button in self.difficulty_buttons.items():
-                    if button.rect.collidepoint(mouse_pos):
-                        self.play_sound('click')
-                        self.difficulty = diff
-                        self.state = "CHARACTER_SELECT"
-                        break
-        
-        elif self.state == "LEADERBOARD":
-            if self.leaderboard_back_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "MAIN_MENU"
-            elif self.clear_leaderboard_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.password_input = ""
-                self.password_error = ""
-                self.state = "PASSWORD_ENTRY"
-            else:
-                for diff, button in self.leaderboard_buttons.items():
-                    if button.rect.collidepoint(mouse_pos):
-                        self.play_sound('click')
-                        self.active_leaderboard = diff
-                        break
-        
-        elif self.state == "NAME_ENTRY":
-            if self.submit_name_button.rect.collidepoint(mouse_pos):
-                is_valid, error_msg = self.validate_name(self.player_name)
-                if is_valid:
-                    self.play_sound('click')
-                    self.add_to_leaderboard(self.player_name, self.score, self.difficulty)
-                    self.entering_name = False
-                    self.state = "GAME_OVER"
-                else:
-                    self.name_error_message = error_msg
-        
-        elif self.state == "PASSWORD_ENTRY":
-            if self.submit_password_button.rect.collidepoint(mouse_pos):
-                if self.password_input == "admin123":
-                    self.play_sound('click')
-                    self.clear_all_leaderboards()
-                    self.password_input = ""
-                    self.password_error = ""
-                    self.state = "LEADERBOARD"
-                else:
-                    self.password_error = "Incorrect password!"
-            elif self.cancel_password_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.password_input = ""
-                self.password_error = ""
-                self.state = "LEADERBOARD"
-        
-        elif self.state == "SETTINGS":
-            if self.settings_back_button.rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                # Return to previous state (could be MAIN_MENU or paused PLAYING)
-                if hasattr(self, 'previous_state') and self.previous_state == "PLAYING":
-                    self.state = "PLAYING"
-                    self.previous_state = None
-                else:
-                    self.state = "MAIN_MENU"
-            elif self.fullscreen_checkbox.handle_click(mouse_pos):
-                self.play_sound('click')
-                self.toggle_fullscreen()
-            elif self.test_sound_dropdown.handle_click(mouse_pos):
-                # Update test sound type based on dropdown selection
-                selected = self.test_sound_dropdown.get_selected()
-                self.test_sound_type = selected.lower()
-                if self.test_sound_dropdown.selected_index != self.test_sound_dropdown.selected_index:  # Selection changed
-                    self.play_sound('click')
-        
-        elif self.state == "GAME_OVER":
-            if self.game_over_buttons['restart'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.start_game()
-            elif self.game_over_buttons['menu'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "MAIN_MENU"
-                self.play_music("menu")
-        
-        elif self.state == "QUIT_CONFIRM":
-            if self.quit_confirm_buttons['yes'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.running = False
-            elif self.quit_confirm_buttons['no'].rect.collidepoint(mouse_pos):
-                self.play_sound('click')
-                self.state = "MAIN_MENU"
-    
-    def handle_pause_click(self, mouse_pos):
-        """Handle pause menu clicks"""
-        if self.pause_buttons['resume'].rect.collidepoint(mouse_pos):
-            self.play_sound('click')
-            self.paused = False
-        elif self.pause_buttons['settings'].rect.collidepoint(mouse_pos):
-            self.play_sound('click')
-            self.previous_state = "PLAYING"
-            self.state = "SETTINGS"
-        elif self.pause_buttons['menu'].rect.collidepoint(mouse_pos):
-            self.play_sound('click')
-            self.state = "MAIN_MENU"
-            self.paused = False
-            self.play_music("menu")
-    
-    def run(self):
-        """Main loop"""
-        while self.running:
-            self.handle_events()
-            
-            if self.state == "PLAYING":
-                if not self.paused:
-                    self.handle_game_input()
-                    self.update_game()
-                self.draw_playing()
-                if self.paused:
-                    self.draw_paused()
-            elif self.state == "MAIN_MENU":
-                self.draw_main_menu()
-            elif self.state == "DIFFICULTY_SELECT":
-                self.draw_difficulty_select()
-            elif self.state == "CHARACTER_SELECT":
-                self.draw_character_select()
-            elif self.state == "LEADERBOARD":
-                self.draw_leaderboard()
-            elif self.state == "NAME_ENTRY":
-                self.draw_name_entry()
-            elif self.state == "PASSWORD_ENTRY":
-                self.draw_password_entry()
-            elif self.state == "SETTINGS":
-                self.draw_settings()
-            elif self.state == "GAME_OVER":
-                self.draw_game_over()
-            elif self.state == "QUIT_CONFIRM":
-                self.draw_quit_confirm()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
-        sys.exit()
-
-
-if __name__ == "__main__":
-    game = Game()
-    game.run()
+"""
+Space Shooter Game - Enhanced Edition
+A classic vertical scrolling shooter with menus and character selection
+
+Controls:
+- Mouse: Navigate menus and click buttons
+- Left/Right Arrow Keys: Move ship
+- Space: Shoot laser
+- ESC: Pause/Return to menu
+"""
+
+import pygame
+import random
+import os
+import sys
+import bisect
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from PIL import Image
+
+# orjson encodes/decodes in C and is well worth using when installed;
+# the stdlib json module is a drop-in fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Initialize Pygame
+pygame.init()
+pygame.mixer.init()
+
+# Game Constants
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+FPS = 60
+MENU_FPS = 30  # static screens do not need the full gameplay rate
+
+# Game states - integer compares are cheaper than the string equality
+# checks the main loop and event handlers do many times per frame
+class State(IntEnum):
+    MAIN_MENU = 0
+    DIFFICULTY_SELECT = 1
+    CHARACTER_SELECT = 2
+    LEADERBOARD = 3
+    NAME_ENTRY = 4
+    PASSWORD_ENTRY = 5
+    SETTINGS = 6
+    PLAYING = 7
+    GAME_OVER = 8
+    QUIT_CONFIRM = 9
+
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 100, 255)
+DARK_BLUE = (0, 50, 150)
+YELLOW = (255, 255, 0)
+GRAY = (150, 150, 150)
+DARK_GRAY = (50, 50, 50)
+LIGHT_GRAY = (200, 200, 200)
+
+# Sound effect names - module-level constants so hot call sites share one
+# interned key instead of re-hashing a fresh literal
+SND_LASER = 'laser'
+SND_EXPLOSION = 'explosion'
+SND_GAME_OVER = 'game_over'
+SND_CLICK = 'click'
+
+def read_json(path):
+    """Parse a JSON file, through orjson when available"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def write_json(path, data):
+    """Write data as indented JSON, through orjson when available"""
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+# Asset path helpers - directory prefixes joined once at import
+IMG_DIR = os.path.join("Assets", "Images")
+AUDIO_DIR = os.path.join("Assets", "Audio")
+FONT_DIR = os.path.join("Assets", "Fonts")
+
+def get_image_path(filename):
+    """Helper function to get image asset path"""
+    return os.path.join(IMG_DIR, filename)
+
+def get_audio_path(filename):
+    """Helper function to get audio asset path"""
+    return os.path.join(AUDIO_DIR, filename)
+
+def get_font_path(filename):
+    """Helper function to get font asset path"""
+    return os.path.join(FONT_DIR, filename)
+
+
+# pygame-ce adds Surface.fblits, a lighter-weight batched blit that skips
+# per-item return rects; fall back to blits on upstream pygame
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Shared sprite surfaces - load/scale/convert each image once and let every
+# instance reference the same Surface
+_sprite_cache = {}
+
+def load_scaled(filename, max_width):
+    """Load an image scaled to max_width, caching the result.
+
+    Returns (surface, width, height), or None if the file can't be loaded.
+    Every surface handed out is already convert_alpha'd - callers must
+    never blit an unconverted copy.
+    """
+    key = (filename, max_width)
+    if key not in _sprite_cache:
+        try:
+            image = pygame.image.load(get_image_path(filename))
+            width = image.get_width()
+            height = image.get_height()
+            if width > max_width:
+                scale_factor = max_width / width
+                width = max_width
+                height = int(height * scale_factor)
+            image = pygame.transform.scale(image, (width, height))
+            # Convert to display format once so every blit skips per-pixel conversion
+            _sprite_cache[key] = (image.convert_alpha(), width, height)
+        except Exception:
+            _sprite_cache[key] = None
+    return _sprite_cache[key]
+
+
+class Button:
+    """Clickable button class for UI elements"""
+    
+    def __init__(self, x, y, width, height, text, font, color=BLUE, hover_color=LIGHT_GRAY, text_color=WHITE):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.font = font
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.is_hovered = False
+        # Button text never changes - render it once here instead of every draw
+        self.text_surface = font.render(text, True, text_color)
+        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+    
+    def draw(self, screen):
+        """Draw button with hover effect"""
+        current_color = self.hover_color if self.is_hovered else self.color
+        # Draw button background with border
+        pygame.draw.rect(screen, current_color, self.rect, border_radius=10)
+        pygame.draw.rect(screen, WHITE, self.rect, 3, border_radius=10)
+        
+        # Draw cached text centered
+        screen.blit(self.text_surface, self.text_rect)
+    
+    def check_hover(self, mouse_pos):
+        """Check if mouse is hovering over button"""
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        return self.is_hovered
+    
+    def is_clicked(self, mouse_pos, mouse_pressed):
+        """Check if button is clicked"""
+        return self.rect.collidepoint(mouse_pos) and mouse_pressed[0]
+
+
+class ButtonGroup:
+    """Buttons hover-tested together behind one union-rect early-out"""
+    
+    def __init__(self, buttons):
+        self.buttons = list(buttons)
+        rects = [button.rect for button in self.buttons]
+        self.bounds = rects[0].unionall(rects[1:])
+    
+    def check_hover(self, mouse_pos):
+        """Update hover states, returning the rects that changed.
+
+        One containment test against the union rect skips the
+        per-button checks whenever the mouse is elsewhere on screen.
+        """
+        dirty = []
+        if self.bounds.collidepoint(mouse_pos):
+            for button in self.buttons:
+                was_hovered = button.is_hovered
+                button.check_hover(mouse_pos)
+                if button.is_hovered != was_hovered:
+                    dirty.append(button.rect)
+        else:
+            for button in self.buttons:
+                if button.is_hovered:
+                    button.is_hovered = False
+                    dirty.append(button.rect)
+        return dirty
+    
+    def draw(self, screen):
+        """Draw every button in the group"""
+        for button in self.buttons:
+            button.draw(screen)
+
+
+class Slider:
+    """Volume slider for settings"""
+    
+    def __init__(self, x, y, width, height, min_val=0, max_val=100, initial_val=50, label=""):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.min_val = min_val
+        self.max_val = max_val
+        self.value = initial_val
+        self.label = label
+        self.dragging = False
+        self.was_dragging = False
+        self.handle_radius = 12
+        # Pixels per value unit, fixed for the slider's lifetime
+        self._scale = self.rect.width / self.max_val
+        # Label surface, re-rendered only when the displayed value changes
+        self._label_surface = None
+        self._label_value = None
+        # Pre-baked track and handle - blitting two cached surfaces beats
+        # re-issuing rect/circle primitives every frame
+        self._track_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(self._track_surface, GRAY, self._track_surface.get_rect(), border_radius=5)
+        self._track_surface = self._track_surface.convert_alpha()
+        radius = self.handle_radius
+        self._handle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self._handle_surface, WHITE, (radius, radius), radius)
+        pygame.draw.circle(self._handle_surface, BLUE, (radius, radius), radius - 3)
+        self._handle_surface = self._handle_surface.convert_alpha()
+        self._recompute_handle()
+    
+    def _recompute_handle(self):
+        """Cache the handle position and hitbox; rerun whenever value changes"""
+        handle_x = int(self.rect.x + self.value * self._scale)
+        radius = self.handle_radius
+        self._handle_pos = (handle_x, self.rect.centery)
+        self._handle_rect = pygame.Rect(handle_x - radius, self.rect.centery - radius,
+                                        radius * 2, radius * 2)
+    
+    def draw(self, screen, font):
+        """Draw slider with label and value"""
+        # Draw label, rasterized only when the shown percentage changes
+        shown = int(self.value)
+        if shown != self._label_value:
+            self._label_surface = font.render(f"{self.label}: {shown}%", True, WHITE)
+            self._label_value = shown
+        screen.blit(self._label_surface, (self.rect.x, self.rect.y - 30))
+        
+        # Draw the pre-baked track and handle at the cached positions
+        screen.blit(self._track_surface, self.rect.topleft)
+        screen.blit(self._handle_surface, self._handle_rect.topleft)
+    
+    def handle_event(self, event, mouse_pos):
+        """Handle mouse events for slider, returns True when released after dragging"""
+        released = False
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self._handle_rect.collidepoint(mouse_pos) or self.rect.collidepoint(mouse_pos):
+                self.dragging = True
+                self.was_dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if self.was_dragging:
+                released = True
+                self.was_dragging = False
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            # Update value based on mouse position
+            relative_x = mouse_pos[0] - self.rect.x
+            self.value = max(self.min_val, min(self.max_val, relative_x / self._scale))
+            self._recompute_handle()
+        
+        return released
+    
+    def get_value(self):
+        """Get current value as 0-1 range"""
+        return self.value / 100.0
+
+
+class Checkbox:
+    """Checkbox for settings"""
+    
+    def __init__(self, x, y, size, label, checked=False):
+        self.rect = pygame.Rect(x, y, size, size)
+        self.label = label
+        self.checked = checked
+        self._label_surface = None
+        # Pre-rasterized checkmark - line drawing per frame is far more
+        # expensive than blitting a tiny cached glyph
+        self._check_glyph = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.line(self._check_glyph, GREEN, (5, size // 2), (size // 2, size - 5), 3)
+        pygame.draw.line(self._check_glyph, GREEN, (size // 2, size - 5), (size - 5, 5), 3)
+        self._check_glyph = self._check_glyph.convert_alpha()
+    
+    def draw(self, screen, font):
+        """Draw checkbox with label"""
+        # Draw checkbox
+        pygame.draw.rect(screen, WHITE, self.rect, 3)
+        if self.checked:
+            screen.blit(self._check_glyph, self.rect)
+        
+        # Draw label (rendered once on first draw)
+        if self._label_surface is None:
+            self._label_surface = font.render(self.label, True, WHITE)
+        screen.blit(self._label_surface, (self.rect.right + 15, self.rect.y))
+    
+    def handle_click(self, mouse_pos):
+        """Toggle checkbox if clicked"""
+        if self.rect.collidepoint(mouse_pos):
+            self.checked = not self.checked
+            return True
+        return False
+
+
+class Dropdown:
+    """Dropdown menu for selecting options"""
+    
+    def __init__(self, x, y, width, height, options, label="", initial_index=0):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.options = options
+        self.label = label
+        self.selected_index = initial_index
+        self.is_open = False
+        self._label_surface = None
+        self._option_surfaces = None
+        # Option rows never move - build their rects once
+        self.option_rects = [pygame.Rect(x, y + height * (i + 1), width, height)
+                             for i in range(len(options))]
+        # Pre-rasterized arrows (the old inline polygons drew "down" in
+        # both branches)
+        self._arrow_up = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.polygon(self._arrow_up, WHITE, [(5, 0), (0, 10), (10, 10)])
+        self._arrow_up = self._arrow_up.convert_alpha()
+        self._arrow_down = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.polygon(self._arrow_down, WHITE, [(0, 0), (10, 0), (5, 10)])
+        self._arrow_down = self._arrow_down.convert_alpha()
+    
+    def draw(self, screen, font, mouse_pos):
+        """Draw dropdown with label"""
+        # Draw label and option text (all rendered once on first draw)
+        if self._option_surfaces is None:
+            self._option_surfaces = [font.render(option, True, WHITE)
+                                     for option in self.options]
+        if self.label:
+            if self._label_surface is None:
+                self._label_surface = font.render(self.label, True, WHITE)
+            screen.blit(self._label_surface, (self.rect.x, self.rect.y - 30))
+        
+        # Draw main box
+        pygame.draw.rect(screen, GRAY, self.rect)
+        pygame.draw.rect(screen, WHITE, self.rect, 2)
+        
+        # Draw selected option
+        screen.blit(self._option_surfaces[self.selected_index],
+                    (self.rect.x + 10, self.rect.y + 5))
+        
+        # Draw cached arrow glyph
+        arrow = self._arrow_up if self.is_open else self._arrow_down
+        screen.blit(arrow, (self.rect.right - 30, self.rect.centery - 5))
+        
+        # Draw options if open
+        if self.is_open:
+            for option_surface, option_rect in zip(self._option_surfaces, self.option_rects):
+                # Highlight on hover
+                if option_rect.collidepoint(mouse_pos):
+                    pygame.draw.rect(screen, BLUE, option_rect)
+                else:
+                    pygame.draw.rect(screen, GRAY, option_rect)
+                
+                pygame.draw.rect(screen, WHITE, option_rect, 2)
+                screen.blit(option_surface, (option_rect.x + 10, option_rect.y + 5))
+    
+    def handle_click(self, mouse_pos):
+        """Handle dropdown clicks, returns True if selection changed"""
+        if self.rect.collidepoint(mouse_pos):
+            self.is_open = not self.is_open
+            return False
+        
+        if self.is_open:
+            for i, option_rect in enumerate(self.option_rects):
+                if option_rect.collidepoint(mouse_pos):
+                    self.selected_index = i
+                    self.is_open = False
+                    return True
+            # Click outside closes dropdown
+            self.is_open = False
+        
+        return False
+    
+    def get_selected(self):
+        """Get currently selected option"""
+        return self.options[self.selected_index]
+
+
+class Player:
+    """Player spaceship class"""
+    
+    def __init__(self, x, y, player_type="player.png"):
+        self.x = x
+        self.y = y
+        self.speed = 8
+        self.player_type = player_type
+        
+        # Shared, pre-scaled player image (max 80px wide)
+        cached = load_scaled(player_type, 80)
+        if cached:
+            self.image, self.width, self.height = cached
+            self.has_image = True
+        else:
+            self.has_image = False
+            self.width = 64
+            self.height = 64
+            print(f"Warning: {player_type} not found. Using rectangle.")
+        
+        # Persistent collision rect - reused by get_rect instead of
+        # allocating a fresh Rect per call
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    
+    def move_left(self):
+        """Move player left with boundary checking"""
+        self.x -= self.speed
+        if self.x < 0:
+            self.x = 0
+        self.rect.x = self.x
+    
+    def move_right(self):
+        """Move player right with boundary checking"""
+        self.x += self.speed
+        if self.x > SCREEN_WIDTH - self.width:
+            self.x = SCREEN_WIDTH - self.width
+        self.rect.x = self.x
+    
+    def draw(self, screen):
+        """Draw the player on screen"""
+        if self.has_image:
+            screen.blit(self.image, self.rect)
+        else:
+            pygame.draw.rect(screen, GREEN, self.rect)
+    
+    def get_rect(self):
+        """Get collision rectangle"""
+        return self.rect
+
+
+class Bullet:
+    """Bullet/Laser projectile class"""
+    
+    WIDTH = None
+    HEIGHT = None
+    
+    @classmethod
+    def dimensions(cls):
+        """Sprite size, resolved once without constructing an instance"""
+        if cls.WIDTH is None:
+            cached = load_scaled("bullet.png", 16)
+            if cached:
+                cls.WIDTH, cls.HEIGHT = cached[1], cached[2]
+            else:
+                cls.WIDTH, cls.HEIGHT = 8, 32
+        return cls.WIDTH, cls.HEIGHT
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.speed = 7
+        
+        # Shared, pre-scaled bullet image (max 16px wide)
+        cached = load_scaled("bullet.png", 16)
+        if cached:
+            self.image, self.width, self.height = cached
+            self.has_image = True
+        else:
+            self.has_image = False
+            self.width = 8
+            self.height = 32
+        
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    
+    def reset(self, x, y):
+        """Re-arm a pooled bullet at a new position"""
+        self.x = x
+        self.y = y
+        self.rect.x = x
+        self.rect.y = y
+    
+    def update(self):
+        """Move bullet upward"""
+        self.y -= self.speed
+        self.rect.y = self.y
+    
+    def is_off_screen(self):
+        """Check if bullet has left the screen"""
+        return self.y < -self.height
+    
+    def draw(self, screen):
+        """Draw the bullet on screen"""
+        if self.has_image:
+            screen.blit(self.image, self.rect)
+        else:
+            pygame.draw.rect(screen, RED, self.rect)
+    
+    def get_rect(self):
+        """Get collision rectangle"""
+        return self.rect
+
+
+class Enemy:
+    """Enemy spaceship class"""
+    
+    WIDTH = None
+    HEIGHT = None
+    
+    @classmethod
+    def dimensions(cls):
+        """Sprite size, resolved once without constructing an instance"""
+        if cls.WIDTH is None:
+            cached = load_scaled("enemy.png", 70)
+            if cached:
+                cls.WIDTH, cls.HEIGHT = cached[1], cached[2]
+            else:
+                cls.WIDTH, cls.HEIGHT = 64, 64
+        return cls.WIDTH, cls.HEIGHT
+    
+    def __init__(self, x, y, speed=2):
+        self.x = x
+        self.y = y
+        self.speed = speed
+        
+        # Shared, pre-scaled enemy image (max 70px wide)
+        cached = load_scaled("enemy.png", 70)
+        if cached:
+            self.image, self.width, self.height = cached
+            self.has_image = True
+        else:
+            self.has_image = False
+            self.width = 64
+            self.height = 64
+        
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    
+    def reset(self, x, y, speed=2):
+        """Re-arm a pooled enemy at a new position"""
+        self.x = x
+        self.y = y
+        self.rect.x = x
+        self.rect.y = y
+        self.speed = speed
+    
+    def update(self):
+        """Move enemy downward"""
+        self.y += self.speed
+        self.rect.y = self.y
+    
+    def is_off_screen(self):
+        """Check if enemy has left the bottom of screen"""
+        return self.y > SCREEN_HEIGHT
+    
+    def draw(self, screen):
+        """Draw the enemy on screen"""
+        if self.has_image:
+            screen.blit(self.image, self.rect)
+        else:
+            pygame.draw.rect(screen, WHITE, self.rect)
+    
+    def get_rect(self):
+        """Get collision rectangle"""
+        return self.rect
+
+
+def advance_bullets(bullets, pool):
+    """Move bullets one step, recycling off-screen ones into the pool.
+
+    Compacts the list in place with a write index - survivors shift
+    down and the tail is dropped, so no replacement list is allocated.
+    Module-level for the same reason as collide_bullets_enemies: the
+    per-frame advance loop should not pay for attribute lookups on self.
+    """
+    write = 0
+    recycle = pool.append
+    for bullet in bullets:
+        # Movement inlined from Bullet.update/is_off_screen - two method
+        # dispatches per bullet per frame are pure overhead here, and a
+        # flat arithmetic loop also traces well under PyPy
+        y = bullet.y - bullet.speed
+        bullet.y = y
+        bullet.rect.y = y
+        if y < -bullet.height:
+            recycle(bullet)
+        else:
+            bullets[write] = bullet
+            write += 1
+    del bullets[write:]
+
+
+def advance_enemies(enemies, pool, speed):
+    """Move enemies one step, recycling ones past the bottom edge.
+
+    All live enemies share the per-game speed, so it comes in as one
+    argument instead of being read off each object. Compacts in place
+    like advance_bullets and returns the number of enemies that got
+    through - the caller charges lives for those.
+    """
+    write = 0
+    passed = 0
+    recycle = pool.append
+    bottom = SCREEN_HEIGHT
+    for enemy in enemies:
+        # Inlined from Enemy.update/is_off_screen, as in advance_bullets
+        y = enemy.y + speed
+        enemy.y = y
+        enemy.rect.y = y
+        if y > bottom:
+            recycle(enemy)
+            passed += 1
+        else:
+            enemies[write] = enemy
+            write += 1
+    del enemies[write:]
+    return passed
+
+
+def collide_bullets_enemies(bullets, enemies):
+    """Find bullet/enemy hit pairs, at most one enemy per bullet.
+
+    Returns two index sets (hit bullets, hit enemies). The inner sweep
+    runs in C via Rect.collidelistall against the persistent enemy
+    rects; Python only arbitrates which hit each bullet claims so two
+    bullets never kill the same enemy.
+    """
+    hit_bullets = set()
+    hit_enemies = set()
+    if not bullets or not enemies:
+        return hit_bullets, hit_enemies
+    enemy_rects = [enemy.rect for enemy in enemies]
+    for bi, bullet in enumerate(bullets):
+        for ei in bullet.rect.collidelistall(enemy_rects):
+            if ei not in hit_enemies:
+                hit_bullets.add(bi)
+                hit_enemies.add(ei)
+                break
+    return hit_bullets, hit_enemies
+
+
+class Game:
+    """Main game class"""
+    
+    def __init__(self):
+        # Initialize display
+        self.fullscreen = False
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Space Shooter")
+        self.clock = pygame.time.Clock()
+        
+        # Only queue event types the game consumes - SDL drops the rest at
+        # the source instead of handle_events clearing them every frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+                                  pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED])
+        
+        # Load fonts
+        try:
+            self.retro_font_small = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 24)
+            self.retro_font_medium = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 36)
+            self.retro_font_large = pygame.font.Font(get_font_path("RETRO_SPACE.ttf"), 48)
+            self.oleaguid_font = pygame.font.Font(get_font_path("Oleaguid.ttf"), 72)
+            print("Custom fonts loaded successfully")
+        except Exception as e:
+            print(f"Error loading fonts: {e}")
+            self.retro_font_small = pygame.font.Font(None, 24)
+            self.retro_font_medium = pygame.font.Font(None, 36)
+            self.retro_font_large = pygame.font.Font(None, 48)
+            self.oleaguid_font = pygame.font.Font(None, 72)
+        
+        # Load background
+        self.load_background()
+        
+        # Warm the shared sprite cache so the first shot/spawn/game start
+        # never hits the disk mid-frame
+        load_scaled("bullet.png", 16)
+        load_scaled("enemy.png", 70)
+        for ship in ("player.png", "player2.PNG", "player3.png"):
+            load_scaled(ship, 80)
+        
+        # Converted solid-black surface reused when no background image is
+        # available - blitting it beats re-filling the framebuffer per frame
+        self.black_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.black_surface.fill(BLACK)
+        
+        # Audio settings
+        self.sfx_volume = 0.5
+        self.music_volume = 0.2
+        self.test_sound_type = "laser"  # Default test sound for SFX slider
+        self.sounds = {}
+        self.load_sounds()
+        
+        # Game state
+        self.state = State.MAIN_MENU
+        self.running = True
+        self.game_over = False
+        self.paused = False
+        self.score = 0
+        self.lives = 5
+        self.difficulty = "medium"  # easy, medium, hard
+        self.game_speed_multiplier = 1.0
+        self.enemy_speed = 2  # recomputed from the multiplier at game start
+        self.high_scores = self.load_high_scores()  # Dictionary with high score per difficulty
+        self.leaderboards = self.load_leaderboards()
+        # Uppercased name sets per difficulty - keeps validate_name O(1)
+        # instead of rescanning (and re-uppercasing) the whole board
+        self._name_sets = {diff: {entry["name"].upper() for entry in entries}
+                           for diff, entries in self.leaderboards.items()}
+        self.selected_character = "player.png"
+        self.player_life_icon = None
+        self.player_name = ""
+        self.entering_name = False
+        self.name_error_message = ""
+        self.password_input = ""
+        self.password_error = ""
+        
+        # Per-frame input snapshots, refreshed at the top of the main loop
+        self._keys = pygame.key.get_pressed()
+        self._mouse_pos = pygame.mouse.get_pos()
+        self._last_drawn_state = None
+        
+        # Memoized font renders keyed by (font, text, color) - FreeType
+        # rasterization is far too slow to repeat per frame
+        self._text_cache = {}
+        # Digit strips keyed by (font, color) for the HUD counters
+        self._digit_cache = {}
+        # Fully composed background + overlay + titles per menu state,
+        # built lazily by _static_base
+        self._menu_base_cache = {}
+        
+        # Frozen frame captured when entering pause; the world doesn't move
+        # while paused so there is no reason to re-render it
+        self._pause_snapshot = None
+
+        # Game objects
+        self.player = None
+        self.bullets = []
+        self.enemies = []
+        self.enemy_spawn_timer = 0
+        self.enemy_spawn_delay = 60
+        
+        # Freelists of retired entities, recycled on spawn so the shot/spawn
+        # path stops constructing objects. Seeded up front so a typical
+        # session never constructs an entity mid-frame; they still grow on
+        # demand if more are ever live at once
+        self._bullet_pool = [Bullet(0, -100) for _ in range(24)]
+        self._enemy_pool = [Enemy(0, -100) for _ in range(16)]
+        
+        # Initialize UI
+        self.init_ui()
+        
+        # O(1) state -> draw method dispatch for the main loop; PLAYING is
+        # handled separately since it also runs input and simulation
+        self._draw_dispatch = {
+            State.MAIN_MENU: self.draw_main_menu,
+            State.DIFFICULTY_SELECT: self.draw_difficulty_select,
+            State.CHARACTER_SELECT: self.draw_character_select,
+            State.LEADERBOARD: self.draw_leaderboard,
+            State.NAME_ENTRY: self.draw_name_entry,
+            State.PASSWORD_ENTRY: self.draw_password_entry,
+            State.SETTINGS: self.draw_settings,
+            State.GAME_OVER: self.draw_game_over,
+            State.QUIT_CONFIRM: self.draw_quit_confirm,
+        }
+        
+        # Start menu music
+        self.play_music("menu")
+    
+    def load_background(self):
+        """Load background image"""
+        self.has_background = False
+        for bg_file in ["background.avif", "background.png", "background.jpg"]:
+            try:
+                bg_path = get_image_path(bg_file)
+                if bg_file.endswith('.avif'):
+                    # The AVIF decode + LANCZOS resize is slow, so the scaled
+                    # result is cached to disk; later launches load the BMP
+                    cache_path = self._background_cache_path()
+                    if (os.path.exists(cache_path)
+                            and os.path.getmtime(cache_path) >= os.path.getmtime(bg_path)):
+                        self.background = pygame.image.load(cache_path)
+                    else:
+                        try:
+                            # pygame-ce builds with AVIF support decode it
+                            # natively; no PIL round-trip needed
+                            self.background = pygame.image.load(bg_path)
+                            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                        except pygame.error:
+                            pil_image = Image.open(bg_path).convert('RGB')
+                            pil_image = pil_image.resize((SCREEN_WIDTH, SCREEN_HEIGHT), Image.Resampling.BILINEAR)
+                            self.background = pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, 'RGB')
+                        self._save_background_cache(cache_path)
+                else:
+                    self.background = pygame.image.load(bg_path)
+                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                # Opaque image - convert to the display format so the
+                # per-frame full-screen blit is a plain copy
+                self.background = self.background.convert()
+                self.has_background = True
+                print(f"Loaded background: {bg_file}")
+                break
+            except:
+                continue
+    
+    def _background_cache_path(self):
+        """Path of the pre-scaled background cache file"""
+        cache_dir = get_image_path(".cache")
+        return os.path.join(cache_dir, f"background_{SCREEN_WIDTH}x{SCREEN_HEIGHT}.bmp")
+    
+    def _save_background_cache(self, cache_path):
+        """Write the decoded background to disk for faster startups"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            pygame.image.save(self.background, cache_path)
+        except Exception as e:
+            print(f"Warning: could not cache background: {e}")
+    
+    def load_sounds(self):
+        """Load sound effects"""
+        sound_files = {
+            SND_LASER: 'laser.wav',
+            SND_EXPLOSION: 'explosion.wav',
+            SND_GAME_OVER: 'game_over.mp3',
+            SND_CLICK: 'click.wav'
+        }
+        
+        def load_one(filename):
+            try:
+                return pygame.mixer.Sound(get_audio_path(filename))
+            except:
+                return None
+        
+        # Sound decoding is disk-bound and releases the GIL, so the four
+        # loads overlap in a small thread pool; the with-block joins them
+        # all before __init__ goes on to play anything
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {name: pool.submit(load_one, filename)
+                       for name, filename in sound_files.items()}
+        for name, future in futures.items():
+            self.sounds[name] = future.result()
+            if self.sounds[name] is None:
+                print(f"Warning: Could not load {sound_files[name]}")
+        
+        # Load gameplay background music
+        self.gameplay_music_loaded = False
+        for music_file in ["background_music.mp3", "background_music.ogg", "background_music.wav"]:
+            try:
+                # Store the path for later use
+                self.gameplay_music_path = get_audio_path(music_file)
+                pygame.mixer.music.load(self.gameplay_music_path)
+                self.gameplay_music_loaded = True
+                print(f"Loaded gameplay music: {music_file}")
+                break
+            except:
+                continue
+        
+        # Load main menu music
+        self.menu_music_loaded = False
+        for music_file in ["main_menu_music.mp3", "main_menu_music.ogg", "main_menu_music.wav"]:
+            try:
+                self.menu_music_path = get_audio_path(music_file)
+                # Don't load it yet, just store the path
+                self.menu_music_loaded = True
+                print(f"Found menu music: {music_file}")
+                break
+            except:
+                continue
+        
+        self.current_music = None  # Track which music is playing
+        self.update_volumes()
+    
+    def update_volumes(self):
+        """Update sound volumes"""
+        if self.sounds.get('explosion'):
+            self.sounds[SND_EXPLOSION].set_volume(0.1 * self.sfx_volume)
+        if self.sounds.get('game_over'):
+            self.sounds[SND_GAME_OVER].set_volume(0.25 * self.sfx_volume)
+        if self.sounds.get('laser'):
+            self.sounds[SND_LASER].set_volume(self.sfx_volume)
+        if self.sounds.get('click'):
+            self.sounds[SND_CLICK].set_volume(0.3 * self.sfx_volume)  # 30% volume for clicks
+        pygame.mixer.music.set_volume(self.music_volume)
+    
+    def play_sound(self, name):
+        """Play sound effect"""
+        if self.sounds.get(name):
+            self.sounds[name].play()
+    
+    def play_music(self, music_type):
+        """Play menu or gameplay music"""
+        if music_type == "menu" and self.menu_music_loaded:
+            if self.current_music != "menu":
+                pygame.mixer.music.stop()
+                pygame.mixer.music.load(self.menu_music_path)
+                pygame.mixer.music.set_volume(self.music_volume)
+                pygame.mixer.music.play(-1)
+                self.current_music = "menu"
+        elif music_type == "gameplay" and self.gameplay_music_loaded:
+            if self.current_music != "gameplay":
+                pygame.mixer.music.stop()
+                pygame.mixer.music.load(self.gameplay_music_path)
+                pygame.mixer.music.set_volume(self.music_volume)
+                pygame.mixer.music.play(-1)
+                self.current_music = "gameplay"
+    
+    def toggle_fullscreen(self):
+        """Toggle fullscreen mode"""
+        self.fullscreen = not self.fullscreen
+        if self.fullscreen:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # The frozen pause frame belongs to the old display surface;
+        # draw_paused rebuilds it on demand
+        self._pause_snapshot = None
+    
+    def init_ui(self):
+        """Initialize UI elements"""
+        cx = SCREEN_WIDTH // 2
+        
+        # Semi-transparent overlay for menu screens, built once instead of
+        # allocating and filling a full-screen surface every frame. Baked
+        # per-pixel alpha blits through SDL's vectorized path, unlike the
+        # slower whole-surface set_alpha blend
+        self.menu_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.menu_overlay.fill((0, 0, 0, 150))
+        # Darker variant for the pause screen
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.pause_overlay.fill((0, 0, 0, 180))
+        
+        # Static labels rendered once - rasterizing identical text every
+        # frame was pure waste
+        self.title_surface = self.oleaguid_font.render("SPACE SHOOTER", True, YELLOW)
+        self.title_rect = self.title_surface.get_rect(center=(cx, 150))
+        self.subtitle_surface = self.retro_font_small.render("A bored GabTzy project", True, WHITE)
+        self.subtitle_rect = self.subtitle_surface.get_rect(center=(cx, 220))
+        self.char_title_surface = self.retro_font_large.render("SELECT YOUR SHIP", True, YELLOW)
+        self.char_title_rect = self.char_title_surface.get_rect(center=(cx, 120))
+        self.settings_title_surface = self.retro_font_large.render("SETTINGS", True, YELLOW)
+        self.settings_title_rect = self.settings_title_surface.get_rect(center=(cx, 120))
+        
+        # Main menu
+        self.main_menu_buttons = {
+            'start': Button(cx - 150, 260, 300, 60, "START", self.retro_font_medium),
+            'leaderboard': Button(cx - 150, 340, 300, 60, "LEADERBOARD", self.retro_font_medium),
+            'settings': Button(cx - 150, 420, 300, 60, "SETTINGS", self.retro_font_medium),
+            'quit': Button(cx - 150, 500, 300, 60, "QUIT", self.retro_font_medium)
+        }
+        self.main_menu_group = ButtonGroup(self.main_menu_buttons.values())
+        
+        # Character selection
+        self.character_buttons = []
+        characters = [("player.png", "SHIP 1"), ("player2.PNG", "SHIP 2"), ("player3.png", "SHIP 3")]
+        for i, (char_file, char_name) in enumerate(characters):
+            x = cx - 270 + (i * 180)
+            preview_rect = pygame.Rect(x, 250, 150, 150)
+            name_surface = self.retro_font_small.render(char_name, True, WHITE)
+            self.character_buttons.append({
+                'file': char_file,
+                'name': char_name,
+                'button': Button(x, 450, 150, 50, "SELECT", self.retro_font_small),
+                'preview_rect': preview_rect,
+                'image': None,  # loaded lazily on first visit to this screen
+                'name_surface': name_surface,
+                'name_rect': name_surface.get_rect(center=(preview_rect.centerx, preview_rect.bottom + 30))
+            })
+        self.char_back_button = Button(50, 50, 150, 50, "BACK", self.retro_font_small)
+        self._char_previews_loaded = False
+        
+        # Difficulty selection
+        self.difficulty_buttons = {
+            'easy': Button(cx - 350, 320, 200, 70, "EASY", self.retro_font_medium, GREEN, LIGHT_GRAY),
+            'medium': Button(cx - 100, 320, 200, 70, "MEDIUM", self.retro_font_medium, BLUE, LIGHT_GRAY),
+            'hard': Button(cx + 150, 320, 200, 70, "HARD", self.retro_font_medium, RED, LIGHT_GRAY)
+        }
+        self.difficulty_back_button = Button(50, 50, 150, 50, "BACK", self.retro_font_small)
+        # Hover info lines rendered once, with their centered positions
+        diff_info = {
+            'easy': "7 Lives | Normal Speed",
+            'medium': "5 Lives | 8% Faster",
+            'hard': "3 Lives | 15% Faster"
+        }
+        self._diff_info = {}
+        for diff, text in diff_info.items():
+            surface = self.retro_font_small.render(text, True, WHITE)
+            rect = self.difficulty_buttons[diff].rect
+            self._diff_info[diff] = (surface, surface.get_rect(center=(rect.centerx, rect.bottom + 30)).topleft)
+        
+        # Leaderboard
+        self.leaderboard_buttons = {
+            'easy': Button(cx - 380, 180, 230, 50, "EASY", self.retro_font_small, GREEN, LIGHT_GRAY),
+            'medium': Button(cx - 115, 180, 230, 50, "MEDIUM", self.retro_font_small, BLUE, LIGHT_GRAY),
+            'hard': Button(cx + 150, 180, 230, 50, "HARD", self.retro_font_small, RED, LIGHT_GRAY)
+        }
+        self.leaderboard_back_button = Button(cx - 100, 650, 200, 50, "BACK", self.retro_font_medium)
+        self.clear_leaderboard_button = Button(cx + 300, 650, 180, 50, "CLEAR ALL", self.retro_font_small, RED, LIGHT_GRAY)
+        self.active_leaderboard = "medium"
+        
+        # Password entry (for clearing leaderboards)
+        self.password_entry_rect = pygame.Rect(cx - 200, 300, 400, 50)
+        self.submit_password_button = Button(cx - 100, 380, 200, 50, "SUBMIT", self.retro_font_medium)
+        self.cancel_password_button = Button(cx - 100, 450, 200, 50, "CANCEL", self.retro_font_medium)
+        
+        # Name entry (for high score)
+        self.name_entry_rect = pygame.Rect(cx - 200, 300, 400, 50)
+        self.submit_name_button = Button(cx - 100, 380, 200, 50, "SUBMIT", self.retro_font_medium)
+        
+        # Settings
+        self.sfx_slider = Slider(cx - 200, 250, 400, 20, 0, 100, self.sfx_volume * 100, "SFX Volume")
+        self.music_slider = Slider(cx - 200, 350, 400, 20, 0, 100, self.music_volume * 100, "Music Volume")
+        self.test_sound_dropdown = Dropdown(cx - 200, 470, 400, 40, ["Laser", "Explosion"], "Test Sound", 0)
+        self.fullscreen_checkbox = Checkbox(cx - 100, 570, 30, "Fullscreen Mode", self.fullscreen)
+        self.settings_back_button = Button(cx - 100, 650, 200, 50, "BACK", self.retro_font_medium)
+        
+        # Game over
+        self.game_over_buttons = {
+            'restart': Button(cx - 250, 400, 200, 60, "RESTART", self.retro_font_medium),
+            'menu': Button(cx + 50, 400, 200, 60, "MENU", self.retro_font_medium)
+        }
+        self.game_over_group = ButtonGroup(self.game_over_buttons.values())
+        
+        # Quit confirm
+        self.quit_confirm_buttons = {
+            'yes': Button(cx - 200, 350, 150, 60, "YES", self.retro_font_medium, RED, LIGHT_GRAY),
+            'no': Button(cx + 50, 350, 150, 60, "NO", self.retro_font_medium, GREEN, LIGHT_GRAY)
+        }
+        self.quit_confirm_group = ButtonGroup(self.quit_confirm_buttons.values())
+        
+        # Pause menu
+        self.pause_buttons = {
+            'resume': Button(cx - 150, 300, 300, 60, "RESUME", self.retro_font_medium),
+            'settings': Button(cx - 150, 380, 300, 60, "SETTINGS", self.retro_font_medium),
+            'menu': Button(cx - 150, 460, 300, 60, "QUIT TO MENU", self.retro_font_medium)
+        }
+        self.pause_group = ButtonGroup(self.pause_buttons.values())
+        
+        self._build_click_actions()
+    
+    def _build_click_actions(self):
+        """Build the per-state (rect, action) click tables.
+
+        handle_mouse_click walks one flat list per state instead of the
+        old chain of collidepoint branches. States whose clicks need
+        conditional logic keep dedicated handlers in _click_handlers.
+        """
+        goto = self._goto
+        self._click_actions = {
+            State.MAIN_MENU: [
+                (self.main_menu_buttons['start'].rect, lambda: goto(State.DIFFICULTY_SELECT)),
+                (self.main_menu_buttons['leaderboard'].rect, lambda: goto(State.LEADERBOARD)),
+                (self.main_menu_buttons['settings'].rect, lambda: goto(State.SETTINGS)),
+                (self.main_menu_buttons['quit'].rect, lambda: goto(State.QUIT_CONFIRM)),
+            ],
+            State.CHARACTER_SELECT: [
+                (self.char_back_button.rect, lambda: goto(State.DIFFICULTY_SELECT)),
+            ] + [
+                (char['button'].rect, lambda f=char['file']: self._select_character(f))
+                for char in self.character_buttons
+            ],
+            State.DIFFICULTY_SELECT: [
+                (self.difficulty_back_button.rect, lambda: goto(State.MAIN_MENU)),
+            ] + [
+                (button.rect, lambda d=diff: self._select_difficulty(d))
+                for diff, button in self.difficulty_buttons.items()
+            ],
+            State.LEADERBOARD: [
+                (self.leaderboard_back_button.rect, lambda: goto(State.MAIN_MENU)),
+                (self.clear_leaderboard_button.rect, self._open_password_entry),
+            ] + [
+                (button.rect, lambda d=diff: self._show_leaderboard(d))
+                for diff, button in self.leaderboard_buttons.items()
+            ],
+            State.GAME_OVER: [
+                (self.game_over_buttons['restart'].rect, self._restart_game),
+                (self.game_over_buttons['menu'].rect, self._return_to_menu),
+            ],
+            State.QUIT_CONFIRM: [
+                (self.quit_confirm_buttons['yes'].rect, self._confirm_quit),
+                (self.quit_confirm_buttons['no'].rect, lambda: goto(State.MAIN_MENU)),
+            ],
+        }
+        self._click_handlers = {
+            State.NAME_ENTRY: self.handle_name_entry_click,
+            State.PASSWORD_ENTRY: self.handle_password_entry_click,
+            State.SETTINGS: self.handle_settings_click,
+        }
+        self._pause_click_actions = [
+            (self.pause_buttons['resume'].rect, self._resume_game),
+            (self.pause_buttons['settings'].rect, self._open_pause_settings),
+            (self.pause_buttons['menu'].rect, self._quit_to_menu),
+        ]
+        # Event-type handlers, looked up by handle_events instead of an
+        # if/elif chain per event
+        self._event_dispatch = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+            pygame.WINDOWEXPOSED: self._on_window_exposed,
+            pygame.WINDOWRESTORED: self._on_window_exposed,
+        }
+    
+    def _on_window_exposed(self, event):
+        """Repaint in full after the window is re-shown.
+
+        The compositor does not repaint us on expose, and the idle-frame
+        skip would otherwise leave the restored window stale until the
+        mouse moves. Forgetting the last drawn state makes the next
+        frame draw and flip unconditionally.
+        """
+        self._last_drawn_state = None
+    
+    def _goto(self, state):
+        """Play the click sound and switch to the given state"""
+        self.play_sound(SND_CLICK)
+        self.state = state
+    
+    def _select_character(self, char_file):
+        """Pick a ship and start the game"""
+        self.play_sound(SND_CLICK)
+        self.selected_character = char_file
+        self.start_game()
+    
+    def _select_difficulty(self, difficulty):
+        """Pick a difficulty and move on to ship selection"""
+        self.play_sound(SND_CLICK)
+        self.difficulty = difficulty
+        self.state = State.CHARACTER_SELECT
+    
+    def _show_leaderboard(self, difficulty):
+        """Switch the visible leaderboard tab"""
+        self.play_sound(SND_CLICK)
+        self.active_leaderboard = difficulty
+    
+    def _open_password_entry(self):
+        """Ask for the admin password before clearing leaderboards"""
+        self.play_sound(SND_CLICK)
+        self.password_input = ""
+        self.password_error = ""
+        self.state = State.PASSWORD_ENTRY
+    
+    def _restart_game(self):
+        """Restart from the game over screen"""
+        self.play_sound(SND_CLICK)
+        self.start_game()
+    
+    def _return_to_menu(self):
+        """Back to the main menu from the game over screen"""
+        self.play_sound(SND_CLICK)
+        self.state = State.MAIN_MENU
+        self.play_music("menu")
+    
+    def _confirm_quit(self):
+        """Quit the game from the confirmation screen"""
+        self.play_sound(SND_CLICK)
+        self.running = False
+    
+    def _resume_game(self):
+        """Resume play from the pause menu"""
+        self.play_sound(SND_CLICK)
+        self.paused = False
+        self._pause_snapshot = None
+    
+    def _open_pause_settings(self):
+        """Open settings from the pause menu"""
+        self.play_sound(SND_CLICK)
+        self.previous_state = State.PLAYING
+        self.state = State.SETTINGS
+    
+    def _quit_to_menu(self):
+        """Abandon the current game and return to the main menu"""
+        self.play_sound(SND_CLICK)
+        self.state = State.MAIN_MENU
+        self.paused = False
+        self._pause_snapshot = None
+        self.play_music("menu")
+    
+    def load_character_preview(self, filename):
+        """Load and scale character preview"""
+        try:
+            img = pygame.image.load(get_image_path(filename))
+            return pygame.transform.scale(img, (120, 120)).convert_alpha()
+        except:
+            return None
+    
+    def load_player_life_icon(self):
+        """Load player life icon (small version of selected ship)"""
+        try:
+            img = pygame.image.load(get_image_path(self.selected_character))
+            self.player_life_icon = pygame.transform.scale(img, (30, 30)).convert_alpha()
+        except:
+            self.player_life_icon = None
+    
+    def load_high_scores(self):
+        """Load high scores from file"""
+        try:
+            if os.path.exists("high_scores.json"):
+                return read_json("high_scores.json")
+        except:
+            pass
+        return {"easy": 0, "medium": 0, "hard": 0}
+    
+    def save_high_scores(self):
+        """Save high scores to file"""
+        try:
+            write_json("high_scores.json", self.high_scores)
+        except Exception as e:
+            print(f"Error saving high scores: {e}")
+    
+    def load_leaderboards(self):
+        """Load leaderboards from file"""
+        try:
+            if os.path.exists("leaderboards.json"):
+                return read_json("leaderboards.json")
+        except:
+            pass
+        return {"easy": [], "medium": [], "hard": []}
+    
+    def save_leaderboards(self):
+        """Save leaderboards to file"""
+        try:
+            write_json("leaderboards.json", self.leaderboards)
+        except Exception as e:
+            print(f"Error saving leaderboards: {e}")
+    
+    def save_leaderboards_async(self):
+        """Write the leaderboards off the main thread.
+
+        Used after a score is added mid-session so the frame never
+        blocks on disk; shutdown-path saves stay synchronous.
+        """
+        threading.Thread(target=self.save_leaderboards, daemon=True).start()
+    
+    def add_to_leaderboard(self, name, score, difficulty):
+        """Add score to leaderboard and keep top 10"""
+        entry = {"name": name[:10], "score": score}  # Limit name to 10 chars
+        board = self.leaderboards[difficulty]
+        # The board is kept sorted, so place the new entry with one
+        # binary-search insert instead of re-sorting; like the old stable
+        # sort, ties leave newer entries below older ones
+        bisect.insort(board, entry, key=lambda e: -e["score"])
+        self._name_sets[difficulty].add(entry["name"].upper())
+        if len(board) > 10:
+            for dropped in board[10:]:
+                self._name_sets[difficulty].discard(dropped["name"].upper())
+            del board[10:]
+        self.save_leaderboards_async()
+    
+    def validate_name(self, name):
+        """Validate player name for leaderboard"""
+        # Check if empty
+        if not name or name.strip() == "":
+            return False, "Please enter a name!"
+        
+        # Check if name already exists in this difficulty's leaderboard
+        if name.upper() in self._name_sets[self.difficulty]:
+            return False, "Username already taken!"
+        
+        return True, ""
+    
+    def clear_all_leaderboards(self):
+        """Clear all leaderboards and high scores"""
+        self.leaderboards = {"easy": [], "medium": [], "hard": []}
+        self._name_sets = {"easy": set(), "medium": set(), "hard": set()}
+        self.high_scores = {"easy": 0, "medium": 0, "hard": 0}
+        self.save_leaderboards()
+        self.save_high_scores()
+        print("All leaderboards and high scores cleared!")
+    
+    def start_game(self):
+        """Start the game"""
+        self.state = State.PLAYING
+        self.game_over = False
+        self.paused = False
+        self.score = 0
+        
+        # Set lives based on difficulty
+        if self.difficulty == "easy":
+            self.lives = 7
+            self.game_speed_multiplier = 1.0
+        elif self.difficulty == "medium":
+            self.lives = 5
+            self.game_speed_multiplier = 1.08
+        else:  # hard
+            self.lives = 3
+            self.game_speed_multiplier = 1.15
+        
+        # One shared enemy speed per game - the old code multiplied the
+        # base speed by the difficulty multiplier on every spawn
+        self.enemy_speed = 2 * self.game_speed_multiplier
+        
+        self.player = Player(SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT - 120, self.selected_character)
+        self.bullets = []
+        self.enemies = []
+        self.enemy_spawn_timer = 0
+        self.load_player_life_icon()
+        self.play_music("gameplay")
+    
+    def spawn_enemy(self):
+        """Spawn enemy"""
+        width, height = Enemy.dimensions()
+        x = random.randint(0, SCREEN_WIDTH - width)
+        if self._enemy_pool:
+            enemy = self._enemy_pool.pop()
+            enemy.reset(x, -height, self.enemy_speed)
+        else:
+            enemy = Enemy(x, -height, self.enemy_speed)
+        self.enemies.append(enemy)
+    
+    def shoot_bullet(self):
+        """Shoot bullet"""
+        if self.player:
+            width, _ = Bullet.dimensions()
+            x = self.player.x + (self.player.width - width) // 2
+            if self._bullet_pool:
+                bullet = self._bullet_pool.pop()
+                bullet.reset(x, self.player.y)
+            else:
+                bullet = Bullet(x, self.player.y)
+            self.bullets.append(bullet)
+            self.play_sound(SND_LASER)
+    
+    def check_collisions(self):
+        """Check collisions"""
+        # Collect hit indices first, then rebuild both lists in one pass,
+        # instead of mutating the lists while iterating over copies.
+        # Skip the kernel outright when either side is empty - common
+        # between volleys
+        hit_bullets = hit_enemies = ()
+        if self.bullets and self.enemies:
+            hit_bullets, hit_enemies = collide_bullets_enemies(self.bullets, self.enemies)
+        for _ in hit_bullets:
+            self.score += 10
+            self.play_sound(SND_EXPLOSION)
+
+        if hit_bullets:
+            bullets = self.bullets
+            write = 0
+            for i, bullet in enumerate(bullets):
+                if i in hit_bullets:
+                    self._bullet_pool.append(bullet)
+                else:
+                    bullets[write] = bullet
+                    write += 1
+            del bullets[write:]
+            enemies = self.enemies
+            write = 0
+            for i, enemy in enumerate(enemies):
+                if i in hit_enemies:
+                    self._enemy_pool.append(enemy)
+                else:
+                    enemies[write] = enemy
+                    write += 1
+            del enemies[write:]
+
+        # Check enemy collision with player - collidelist runs the whole
+        # sweep in C instead of one colliderect call per enemy
+        if self.player and self.enemies:
+            hit = self.player.rect.collidelist([enemy.rect for enemy in self.enemies])
+            if hit != -1:
+                self._enemy_pool.append(self.enemies[hit])
+                del self.enemies[hit]
+                self.lives -= 1
+                self.play_sound(SND_EXPLOSION)
+                if self.lives <= 0:
+                    self.end_game()
+    
+    def end_game(self):
+        """End the game and update high score"""
+        self.game_over = True
+        pygame.mixer.music.stop()
+        self.play_sound(SND_GAME_OVER)
+        
+        # Update high score for this difficulty if needed
+        if self.score > self.high_scores[self.difficulty]:
+            self.high_scores[self.difficulty] = self.score
+            self.save_high_scores()
+        
+        # Check if score qualifies for leaderboard (top 10 or less than 10 entries)
+        leaderboard = self.leaderboards[self.difficulty]
+        if len(leaderboard) < 10 or self.score > leaderboard[-1]["score"]:
+            self.entering_name = True
+            self.player_name = ""
+            self.name_error_message = ""
+            self.state = State.NAME_ENTRY
+        else:
+            self.state = State.GAME_OVER
+    
+    def update_game(self):
+        """Update game"""
+        if self.game_over:
+            return
+        
+        # Advance + cull in a single pass via the module-level kernels;
+        # list.remove inside the loop was an O(N) scan per dropped entity
+        advance_bullets(self.bullets, self._bullet_pool)
+
+        passed = advance_enemies(self.enemies, self._enemy_pool, self.enemy_speed)
+        if passed:
+            # Lose a life for each enemy that got through
+            self.lives -= passed
+            if self.lives <= 0:
+                self.end_game()
+        
+        self.enemy_spawn_timer += 1
+        if self.enemy_spawn_timer >= self.enemy_spawn_delay:
+            self.spawn_enemy()
+            self.enemy_spawn_timer = 0
+        
+        self.check_collisions()
+    
+    def handle_game_input(self):
+        """Handle game input"""
+        if not self.game_over and self.player:
+            keys = self._keys
+            if keys[pygame.K_LEFT]:
+                self.player.move_left()
+            if keys[pygame.K_RIGHT]:
+                self.player.move_right()
+    
+    def _rtext(self, font, text, color):
+        """Render text through the memo cache"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Dynamic strings (score values) land here too; keep the cache
+            # from growing without bound over a long session
+            if len(self._text_cache) > 512:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
+    def _digits(self, font, color):
+        """Digit surfaces 0-9 for one font/color, built on first use"""
+        key = (id(font), color)
+        strip = self._digit_cache.get(key)
+        if strip is None:
+            strip = [font.render(str(d), True, color) for d in range(10)]
+            self._digit_cache[key] = strip
+        return strip
+    
+    def _blit_number(self, font, color, value, pos):
+        """Draw an integer digit by digit from the cached strip.
+
+        Ten tiny surfaces cover every possible counter value, where the
+        string cache would rasterize each new score once.
+        """
+        text = str(value)
+        if not text.isdigit():
+            # Negative or otherwise non-digit values (lives can briefly
+            # dip below zero on the final frame) take the string cache
+            self.screen.blit(self._rtext(font, text, color), pos)
+            return
+        digits = self._digits(font, color)
+        x, y = pos
+        for ch in text:
+            glyph = digits[int(ch)]
+            self.screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+    
+    def _rtext_center(self, font, text, color, center):
+        """Like _rtext, but also caches the centered top-left position"""
+        key = (id(font), text, color, center)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) > 512:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            cached = (surface, surface.get_rect(center=center).topleft)
+            self._text_cache[key] = cached
+        return cached
+    
+    def draw_background(self):
+        """Draw background"""
+        if self.has_background:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.blit(self.black_surface, (0, 0))
+        
+        if self.state != State.PLAYING:
+            self.screen.blit(self.menu_overlay, (0, 0))
+    
+    def _static_base(self, state, elements):
+        """Composed background, overlay and static text for a menu state.
+
+        Built once per state and cached: each menu frame then starts
+        from a single opaque blit instead of re-layering the
+        background, the overlay and every title surface.
+        """
+        base = self._menu_base_cache.get(state)
+        if base is None:
+            base = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            base.blit(self.background if self.has_background else self.black_surface, (0, 0))
+            base.blit(self.menu_overlay, (0, 0))
+            for surface, pos in elements:
+                base.blit(surface, pos)
+            self._menu_base_cache[state] = base
+        return base
+    
+    def draw_main_menu(self):
+        """Draw main menu, returning the rects that changed this frame"""
+        self.screen.blit(self._static_base(State.MAIN_MENU, (
+            (self.title_surface, self.title_rect),
+            (self.subtitle_surface, self.subtitle_rect),
+        )), (0, 0))
+        
+        dirty = self.main_menu_group.check_hover(self._mouse_pos)
+        self.main_menu_group.draw(self.screen)
+        return dirty
+    
+    def _ensure_char_previews(self):
+        """Load the ship preview images on first visit to this screen"""
+        if not self._char_previews_loaded:
+            for char in self.character_buttons:
+                char['image'] = self.load_character_preview(char['file'])
+            self._char_previews_loaded = True
+    
+    def draw_character_select(self):
+        """Draw character selection"""
+        self._ensure_char_previews()
+        self.screen.blit(self._static_base(State.CHARACTER_SELECT, (
+            (self.char_title_surface, self.char_title_rect),
+        )), (0, 0))
+        
+        mouse_pos = self._mouse_pos
+        for char in self.character_buttons:
+            # Draw preview
+            pygame.draw.rect(self.screen, DARK_BLUE, char['preview_rect'], border_radius=10)
+            pygame.draw.rect(self.screen, WHITE if char['file'] == self.selected_character else GRAY, 
+                           char['preview_rect'], 3, border_radius=10)
+            
+            if char['image']:
+                img_rect = char['image'].get_rect(center=char['preview_rect'].center)
+                self.screen.blit(char['image'], img_rect)
+            
+            # Draw name
+            self.screen.blit(char['name_surface'], char['name_rect'])
+            
+            # Draw button
+            char['button'].check_hover(mouse_pos)
+            char['button'].draw(self.screen)
+        
+        self.char_back_button.check_hover(mouse_pos)
+        self.char_back_button.draw(self.screen)
+    
+    def draw_settings(self):
+        """Draw settings"""
+        self.screen.blit(self._static_base(State.SETTINGS, (
+            (self.settings_title_surface, self.settings_title_rect),
+        )), (0, 0))
+        
+        mouse_pos = self._mouse_pos
+        self.sfx_slider.draw(self.screen, self.retro_font_small)
+        self.music_slider.draw(self.screen, self.retro_font_small)
+        self.test_sound_dropdown.draw(self.screen, self.retro_font_small, mouse_pos)
+        self.fullscreen_checkbox.draw(self.screen, self.retro_font_small)
+        
+        self.settings_back_button.check_hover(mouse_pos)
+        self.settings_back_button.draw(self.screen)
+    
+    def draw_entities(self):
+        """Draw the player, bullets and enemies with one batched blits call.
+
+        Bullets and enemies stay plain lists rather than
+        pygame.sprite.Group: the Group draw path is the same batched
+        blit we already do here, and lists keep the pooling in
+        spawn/update and the index-based collision kernel simple.
+        """
+        # Locals for everything touched per entity - LOAD_FAST instead of
+        # repeated self attribute lookups in the hottest draw loop
+        screen = self.screen
+        player = self.player
+        bullets = self.bullets
+        enemies = self.enemies
+        blit_seq = [(player.image, player.rect)] if player and player.has_image else []
+        blit_seq += [(b.image, b.rect) for b in bullets if b.has_image]
+        # Enemies spawn above the top edge; skip them until any part is
+        # on screen (bullets are culled the frame they leave, so they
+        # never need this test)
+        blit_seq += [(e.image, e.rect) for e in enemies
+                     if e.has_image and e.rect.bottom > 0]
+        if blit_seq:
+            if _HAS_FBLITS:
+                screen.fblits(blit_seq)
+            else:
+                screen.blits(blit_seq, doreturn=False)
+
+        # Fallback rectangles for any sprite whose image failed to load
+        if player and not player.has_image:
+            player.draw(screen)
+        for bullet in bullets:
+            if not bullet.has_image:
+                bullet.draw(screen)
+        for enemy in enemies:
+            if not enemy.has_image:
+                enemy.draw(screen)
+
+    def draw_playing(self):
+        """Draw gameplay"""
+        screen = self.screen
+        self.draw_background()
+        
+        self.draw_entities()
+
+        # Draw score - static prefix plus per-digit blits, so no string
+        # is built or rasterized however often the value changes
+        score_label = self._rtext(self.retro_font_medium, "SCORE: ", YELLOW)
+        screen.blit(score_label, (10, 10))
+        self._blit_number(self.retro_font_medium, YELLOW, self.score, (10 + score_label.get_width(), 10))
+        
+        # Draw high score for current difficulty
+        high_label = self._rtext(self.retro_font_small, "HIGH SCORE: ", WHITE)
+        screen.blit(high_label, (10, 50))
+        self._blit_number(self.retro_font_small, WHITE, self.high_scores[self.difficulty], (10 + high_label.get_width(), 50))
+        
+        # Draw lives with player icon
+        lives_x = SCREEN_WIDTH - 80
+        self._blit_number(self.retro_font_medium, GREEN, self.lives, (lives_x, 10))
+        
+        # Draw player life icon
+        if self.player_life_icon:
+            icon_x = lives_x - 40
+            screen.blit(self.player_life_icon, (icon_x, 15))
+    
+    def draw_game_over(self):
+        """Draw game over"""
+        self.draw_background()
+        
+        title, title_pos = self._rtext_center(self.oleaguid_font, "GAME OVER", RED, (SCREEN_WIDTH // 2, 200))
+        self.screen.blit(title, title_pos)
+        
+        score_text, score_pos = self._rtext_center(self.retro_font_large, "FINAL SCORE: " + str(self.score), WHITE, (SCREEN_WIDTH // 2, 310))
+        self.screen.blit(score_text, score_pos)
+        
+        high_score_text, high_score_pos = self._rtext_center(self.retro_font_medium, "HIGH SCORE: " + str(self.high_scores[self.difficulty]), YELLOW, (SCREEN_WIDTH // 2, 360))
+        self.screen.blit(high_score_text, high_score_pos)
+        
+        dirty = self.game_over_group.check_hover(self._mouse_pos)
+        self.game_over_group.draw(self.screen)
+        return dirty
+    
+    def draw_quit_confirm(self):
+        """Draw quit confirmation"""
+        self.screen.blit(self._static_base(State.QUIT_CONFIRM, (
+            self._rtext_center(self.retro_font_large, "ARE YOU SURE?", YELLOW, (SCREEN_WIDTH // 2, 220)),
+            self._rtext_center(self.retro_font_small, "Do you want to quit the game?", WHITE, (SCREEN_WIDTH // 2, 290)),
+        )), (0, 0))
+        
+        dirty = self.quit_confirm_group.check_hover(self._mouse_pos)
+        self.quit_confirm_group.draw(self.screen)
+        return dirty
+    
+    def draw_paused(self):
+        """Draw pause screen"""
+        # Blit the frozen frame captured on pause entry instead of
+        # re-rendering the whole static scene
+        if self._pause_snapshot is None:
+            self.draw_playing()
+            self._pause_snapshot = self.screen.copy()
+        self.screen.blit(self._pause_snapshot, (0, 0))
+        
+        # Draw semi-transparent overlay
+        self.screen.blit(self.pause_overlay, (0, 0))
+        
+        # Draw PAUSED title
+        title, title_pos = self._rtext_center(self.oleaguid_font, "PAUSED", YELLOW, (SCREEN_WIDTH // 2, 200))
+        self.screen.blit(title, title_pos)
+        
+        # Draw subtitle
+        subtitle, subtitle_pos = self._rtext_center(self.retro_font_small, "Game is paused - Choose an option", WHITE, (SCREEN_WIDTH // 2, 280))
+        self.screen.blit(subtitle, subtitle_pos)
+        
+        # Draw buttons
+        self.pause_group.check_hover(self._mouse_pos)
+        self.pause_group.draw(self.screen)
+    
+    def draw_difficulty_select(self):
+        """Draw difficulty selection, returning the rects that changed"""
+        title, title_pos = self._rtext_center(self.retro_font_large, "SELECT DIFFICULTY", YELLOW, (SCREEN_WIDTH // 2, 120))
+        self.screen.blit(self._static_base(State.DIFFICULTY_SELECT, (
+            (title, title_pos),
+        )), (0, 0))
+        
+        mouse_pos = self._mouse_pos
+        dirty = []
+        
+        # Draw buttons and show info only on hover; a hover change also
+        # dirties the info region so its appearance/removal is presented
+        for diff, button in self.difficulty_buttons.items():
+            was_hovered = button.is_hovered
+            button.check_hover(mouse_pos)
+            button.draw(self.screen)
+            
+            info, info_pos = self._diff_info[diff]
+            if button.is_hovered:
+                self.screen.blit(info, info_pos)
+            if button.is_hovered != was_hovered:
+                dirty.append(button.rect)
+                dirty.append(info.get_rect(topleft=info_pos))
+        
+        back = self.difficulty_back_button
+        was_hovered = back.is_hovered
+        back.check_hover(mouse_pos)
+        back.draw(self.screen)
+        if back.is_hovered != was_hovered:
+            dirty.append(back.rect)
+        return dirty
+    
+    def draw_leaderboard(self):
+        """Draw leaderboard"""
+        self.draw_background()
+        
+        title, title_pos = self._rtext_center(self.retro_font_large, "LEADERBOARD", YELLOW, (SCREEN_WIDTH // 2, 80))
+        self.screen.blit(title, title_pos)
+        
+        # Draw difficulty tabs
+        mouse_pos = self._mouse_pos
+        for diff, button in self.leaderboard_buttons.items():
+            if diff == self.active_leaderboard:
+                # Highlight active tab
+                pygame.draw.rect(self.screen, button.color, button.rect.inflate(4, 4), border_radius=8)
+            button.check_hover(mouse_pos)
+            button.draw(self.screen)
+        
+        # Draw leaderboard entries
+        leaderboard = self.leaderboards[self.active_leaderboard]
+        y_start = 260
+        for i, entry in enumerate(leaderboard):
+            rank_text = self._rtext(self.retro_font_small, "#" + str(i + 1), YELLOW)
+            name_text = self._rtext(self.retro_font_small, entry["name"], WHITE)
+            score_text = self._rtext(self.retro_font_small, str(entry["score"]), GREEN)
+            
+            self.screen.blit(rank_text, (200, y_start + i * 35))
+            self.screen.blit(name_text, (300, y_start + i * 35))
+            self.screen.blit(score_text, (900, y_start + i * 35))
+        
+        # If leaderboard is empty
+        if not leaderboard:
+            empty_text, empty_pos = self._rtext_center(self.retro_font_medium, "No scores yet!", GRAY, (SCREEN_WIDTH // 2, 400))
+            self.screen.blit(empty_text, empty_pos)
+        
+        self.leaderboard_back_button.check_hover(mouse_pos)
+        self.leaderboard_back_button.draw(self.screen)
+        
+        self.clear_leaderboard_button.check_hover(mouse_pos)
+        self.clear_leaderboard_button.draw(self.screen)
+    
+    def draw_name_entry(self):
+        """Draw name entry screen"""
+        self.draw_background()
+        
+        title, title_pos = self._rtext_center(self.oleaguid_font, "NEW HIGH SCORE!", YELLOW, (SCREEN_WIDTH // 2, 150))
+        self.screen.blit(title, title_pos)
+        
+        score_text = self._rtext(self.retro_font_large, "Score: " + str(self.score), WHITE)
+        self.screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 230)))
+        
+        prompt, prompt_pos = self._rtext_center(self.retro_font_small, "Enter your name (max 10 characters):", WHITE, (SCREEN_WIDTH // 2, 270))
+        self.screen.blit(prompt, prompt_pos)
+        
+        # Draw input box
+        pygame.draw.rect(self.screen, WHITE, self.name_entry_rect, 3)
+        name_surface = self._rtext(self.retro_font_medium, self.player_name + "_", WHITE)
+        self.screen.blit(name_surface, (self.name_entry_rect.x + 10, self.name_entry_rect.y + 10))
+        
+        # Draw error message if any
+        if self.name_error_message:
+            error_surface, error_pos = self._rtext_center(self.retro_font_small, self.name_error_message, RED, (SCREEN_WIDTH // 2, 360))
+            self.screen.blit(error_surface, error_pos)
+        
+        mouse_pos = self._mouse_pos
+        self.submit_name_button.check_hover(mouse_pos)
+        self.submit_name_button.draw(self.screen)
+    
+    def draw_password_entry(self):
+        """Draw password entry screen for clearing leaderboards"""
+        self.draw_background()
+        
+        title, title_pos = self._rtext_center(self.retro_font_large, "ADMIN ACCESS", RED, (SCREEN_WIDTH // 2, 150))
+        self.screen.blit(title, title_pos)
+        
+        warning, warning_pos = self._rtext_center(self.retro_font_medium, "Clear All Leaderboards?", YELLOW, (SCREEN_WIDTH // 2, 220))
+        self.screen.blit(warning, warning_pos)
+        
+        prompt, prompt_pos = self._rtext_center(self.retro_font_small, "Enter admin password:", WHITE, (SCREEN_WIDTH // 2, 270))
+        self.screen.blit(prompt, prompt_pos)
+        
+        # Draw password input box (show asterisks)
+        pygame.draw.rect(self.screen, WHITE, self.password_entry_rect, 3)
+        password_display = "*" * len(self.password_input) + "_"
+        password_surface = self._rtext(self.retro_font_medium, password_display, WHITE)
+        self.screen.blit(password_surface, (self.password_entry_rect.x + 10, self.password_entry_rect.y + 10))
+        
+        # Draw error message if any
+        if self.password_error:
+            error_surface, error_pos = self._rtext_center(self.retro_font_small, self.password_error, RED, (SCREEN_WIDTH // 2, 360))
+            self.screen.blit(error_surface, error_pos)
+        
+        mouse_pos = self._mouse_pos
+        self.submit_password_button.check_hover(mouse_pos)
+        self.submit_password_button.draw(self.screen)
+        
+        self.cancel_password_button.check_hover(mouse_pos)
+        self.cancel_password_button.draw(self.screen)
+    
+    def _on_quit(self, event):
+        """Window close request"""
+        self.running = False
+    
+    def _on_keydown(self, event):
+        """Route a key press by current state"""
+        # Password entry
+        if self.state == State.PASSWORD_ENTRY:
+            if event.key == pygame.K_RETURN:
+                if self.password_input == "admin123":
+                    self.clear_all_leaderboards()
+                    self.password_input = ""
+                    self.password_error = ""
+                    self.state = State.LEADERBOARD
+                else:
+                    self.password_error = "Incorrect password!"
+            elif event.key == pygame.K_BACKSPACE:
+                self.password_input = self.password_input[:-1]
+                self.password_error = ""
+            elif event.key == pygame.K_ESCAPE:
+                self.password_input = ""
+                self.password_error = ""
+                self.state = State.LEADERBOARD
+            elif len(self.password_input) < 20 and event.unicode.isprintable():
+                self.password_input += event.unicode
+                self.password_error = ""
+        # Name entry
+        elif self.state == State.NAME_ENTRY:
+            if event.key == pygame.K_RETURN:
+                is_valid, error_msg = self.validate_name(self.player_name)
+                if is_valid:
+                    self.add_to_leaderboard(self.player_name, self.score, self.difficulty)
+                    self.entering_name = False
+                    self.state = State.GAME_OVER
+                else:
+                    self.name_error_message = error_msg
+            elif event.key == pygame.K_BACKSPACE:
+                self.player_name = self.player_name[:-1]
+                self.name_error_message = ""  # Clear error when typing
+            elif len(self.player_name) < 10 and event.unicode.isprintable():
+                self.player_name += event.unicode.upper()
+                self.name_error_message = ""  # Clear error when typing
+        # Only allow ESC to pause during active gameplay
+        elif event.key == pygame.K_ESCAPE and self.state == State.PLAYING and not self.game_over:
+            self.paused = not self.paused
+            if self.paused:
+                # Freeze the last rendered frame for the pause screen
+                self._pause_snapshot = self.screen.copy()
+            else:
+                self._pause_snapshot = None
+        # Allow shooting only when not paused
+        elif event.key == pygame.K_SPACE and self.state == State.PLAYING and not self.game_over and not self.paused:
+            self.shoot_bullet()
+    
+    def _on_mousedown(self, event):
+        """Route a mouse press to the pause menu or the state tables"""
+        if self.state == State.PLAYING and self.paused:
+            self.handle_pause_click(self._mouse_pos)
+        else:
+            self.handle_mouse_click(self._mouse_pos)
+    
+    def handle_events(self):
+        """Handle events, returning True if any were dispatched"""
+        if self.state == State.SETTINGS:
+            # The sliders need motion and button-up events while dragging
+            events = pygame.event.get()
+        else:
+            # Everywhere else only these types are dispatched; pull
+            # just those and drop the mouse motion noise in bulk. Clearing
+            # only those types keeps input that raced in between the calls
+            events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                       pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED])
+            pygame.event.clear((pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP))
+        
+        dispatch = self._event_dispatch
+        mouse_pos = self._mouse_pos
+        for event in events:
+            handler = dispatch.get(event.type)
+            if handler is not None:
+                handler(event)
+            
+            # Handle sliders
+            if self.state == State.SETTINGS:
+                sfx_released = self.sfx_slider.handle_event(event, mouse_pos)
+                self.music_slider.handle_event(event, mouse_pos)
+                self.sfx_volume = self.sfx_slider.get_value()
+                self.music_volume = self.music_slider.get_value()
+                self.update_volumes()
+                
+                # Play test sound when SFX slider is released
+                if sfx_released:
+                    if self.test_sound_type == "laser":
+                        self.play_sound(SND_LASER)
+                    elif self.test_sound_type == "explosion":
+                        self.play_sound(SND_EXPLOSION)
+        
+        return bool(events)
+    
+    def handle_mouse_click(self, mouse_pos):
+        """Handle mouse clicks via the per-state action tables"""
+        actions = self._click_actions.get(self.state)
+        if actions is not None:
+            for rect, action in actions:
+                if rect.collidepoint(mouse_pos):
+                    action()
+                    return
+            return
+        handler = self._click_handlers.get(self.state)
+        if handler is not None:
+            handler(mouse_pos)
+    
+    def handle_name_entry_click(self, mouse_pos):
+        """Handle clicks on the name entry screen"""
+        if self.submit_name_button.rect.collidepoint(mouse_pos):
+            is_valid, error_msg = self.validate_name(self.player_name)
+            if is_valid:
+                self.play_sound(SND_CLICK)
+                self.add_to_leaderboard(self.player_name, self.score, self.difficulty)
+                self.entering_name = False
+                self.state = State.GAME_OVER
+            else:
+                self.name_error_message = error_msg
+    
+    def handle_password_entry_click(self, mouse_pos):
+        """Handle clicks on the password entry screen"""
+        if self.submit_password_button.rect.collidepoint(mouse_pos):
+            if self.password_input == "admin123":
+                self.play_sound(SND_CLICK)
+                self.clear_all_leaderboards()
+                self.password_input = ""
+                self.password_error = ""
+                self.state = State.LEADERBOARD
+            else:
+                self.password_error = "Incorrect password!"
+        elif self.cancel_password_button.rect.collidepoint(mouse_pos):
+            self.play_sound(SND_CLICK)
+            self.password_input = ""
+            self.password_error = ""
+            self.state = State.LEADERBOARD
+    
+    def handle_settings_click(self, mouse_pos):
+        """Handle clicks on the settings screen"""
+        if self.settings_back_button.rect.collidepoint(mouse_pos):
+            self.play_sound(SND_CLICK)
+            # Return to previous state (could be MAIN_MENU or paused PLAYING)
+            if hasattr(self, 'previous_state') and self.previous_state == State.PLAYING:
+                self.state = State.PLAYING
+                self.previous_state = None
+            else:
+                self.state = State.MAIN_MENU
+        elif self.fullscreen_checkbox.handle_click(mouse_pos):
+            self.play_sound(SND_CLICK)
+            self.toggle_fullscreen()
+        else:
+            # Compare against the index captured before the click - the old
+            # check compared selected_index to itself and never fired
+            prev_index = self.test_sound_dropdown.selected_index
+            if self.test_sound_dropdown.handle_click(mouse_pos):
+                self.test_sound_type = self.test_sound_dropdown.get_selected().lower()
+                if self.test_sound_dropdown.selected_index != prev_index:
+                    self.play_sound(SND_CLICK)
+    
+    def handle_pause_click(self, mouse_pos):
+        """Handle pause menu clicks"""
+        for rect, action in self._pause_click_actions:
+            if rect.collidepoint(mouse_pos):
+                action()
+                return
+    
+    def run(self):
+        """Main loop"""
+        prev_mouse = None
+        while self.running:
+            # Snapshot input state once per frame for all consumers
+            self._keys = pygame.key.get_pressed()
+            self._mouse_pos = pygame.mouse.get_pos()
+            had_events = self.handle_events()
+            
+            # Draw methods may return a list of dirty rects for static
+            # screens; None means the whole frame changed and needs a flip
+            if self.state == State.PLAYING:
+                dirty = None
+                # update_game() may end the game and change self.state,
+                # but the frame rendered below is still the gameplay one
+                drawn_state = State.PLAYING
+                if self.paused:
+                    self.draw_paused()
+                else:
+                    self.handle_game_input()
+                    self.update_game()
+                    self.draw_playing()
+            else:
+                # Idle menu frame: same state, no events, mouse not moved -
+                # nothing on screen can have changed, so skip drawing too
+                if (not had_events and self.state == self._last_drawn_state
+                        and self._mouse_pos == prev_mouse):
+                    self.clock.tick(MENU_FPS)
+                    continue
+                drawn_state = self.state
+                dirty = self._draw_dispatch[self.state]()
+            
+            if dirty is None or self.state != self._last_drawn_state:
+                # Full present on dynamic frames and on state entry
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            self._last_drawn_state = drawn_state
+            prev_mouse = self._mouse_pos
+            # Menus and the pause screen are static - ticking them at 30
+            # halves idle CPU/GPU use without touching gameplay feel
+            if self.state == State.PLAYING and not self.paused:
+                self.clock.tick(FPS)
+            else:
+                self.clock.tick(MENU_FPS)
+        
+        pygame.quit()
+        sys.exit()
+
+
+if __name__ == "__main__":
+    game = Game()
+    game.run()